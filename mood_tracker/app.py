@@ -1,7 +1,7 @@
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer
 
-from .models.storage import init_storage
+from .models.storage import init_storage_async
 from .views.main import MainScreen
 
 
@@ -21,10 +21,11 @@ class MoodTrackerApp(App):
 
     def on_mount(self) -> None:
         """Run when the app starts."""
-        # Make sure the data directory / file exist
-        init_storage()
         # Show our single main screen (the big box UI)
         self.push_screen(MainScreen())
+        # Make sure the data store exists (migrating older formats on the
+        # first run) off the event loop; the history waits for it
+        self.run_worker(init_storage_async(), group="storage")
 
     def compose(self) -> ComposeResult:
         """Declare the layout: header, footer, and our screen stack."""
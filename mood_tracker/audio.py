@@ -1,75 +1,222 @@
 from __future__ import annotations
 
-from pathlib import Path
+import atexit
+import math
+import os
+import queue
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Optional, Tuple
 
-# We'll handle the import gracefully in case the library isn't installed
-try:
-    import pygame.mixer  # type: ignore
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
+# pygame takes over 100 ms to import, which used to sit between launching
+# the app and its first frame. SoundManager imports it on a background
+# thread instead; until then (or if the library isn't installed) this
+# stays None. NumPy, if installed, speeds up synthesizing the tones and
+# is loaded the same way.
+pygame = None
+numpy = None
+
+# Sound names
+SELECT = "select"
+SAVE = "save"
+
+# Tones are pitched by mood: a whole tone per point, A4 at Meh (5)
+BASE_FREQUENCY = 440.0
+BASE_SCORE = 5
+VOLUME = 0.25  # of full scale, so the UI sounds stay in the background
+ATTACK = 0.005  # seconds of fade-in, so tones start without a click
+SELECT_DURATION = 0.06
+# The save chime: (semitones above the mood's pitch, seconds) per note
+SAVE_NOTES = ((0, 0.09), (7, 0.16))
+
+
+def pitch_for_score(score: int) -> float:
+    """Frequency in Hz of the tone for a mood score."""
+    return BASE_FREQUENCY * 2 ** ((score - BASE_SCORE) * 2 / 12)
+
+
+def synthesize_tone(
+    frequency: float, duration: float, sample_rate: int, channels: int = 1
+) -> array:
+    """A sine tone with a short fade-in and an exponential decay.
+
+    Returns signed 16-bit samples, interleaved when there are several
+    channels, ready to hand to the mixer as a buffer.
+    """
+    count = int(sample_rate * duration)
+    amplitude = VOLUME * 32767
+    step = 2 * math.pi * frequency / sample_rate
+    attack = max(1, int(sample_rate * ATTACK))
+    # Down to e**-5 (under 1%) by the end, so it doesn't stop with a click
+    decay = count / 5
+
+    if numpy is not None:
+        i = numpy.arange(count)
+        envelope = numpy.minimum(1.0, i / attack) * numpy.exp(-i / decay)
+        mono = (numpy.sin(i * step) * envelope * amplitude).astype(numpy.int16)
+        samples = array("h")
+        samples.frombytes(numpy.repeat(mono, channels))
+        return samples
+
+    exp = math.exp
+    sin = math.sin
+    mono = array(
+        "h",
+        [
+            int(sin(i * step) * min(1.0, i / attack) * exp(-i / decay) * amplitude)
+            for i in range(count)
+        ],
+    )
+    if channels == 1:
+        return mono
+    samples = array("h", bytes(2 * count * channels))
+    for channel in range(channels):
+        samples[channel::channels] = mono
+    return samples
 
 
 class SoundManager:
     """Manages audio playback for UI feedback sounds.
-    
+
     This class abstracts away the complexity of cross-platform audio
     playback and handles errors gracefully. If audio isn't available
     or fails to play, the app continues working normally.
+
+    The sounds are synthesized in memory, pitched by mood score, so
+    nothing is read from disk. Everything touching pygame happens on
+    one background thread: it loads the mixer, builds each tone the
+    first time it's needed, then plays whatever the UI queues up.
+    Queueing never blocks, and a selection click that comes in while
+    the previous click is still sounding (an arrow key held down) is
+    dropped instead of piling up behind it.
+
+    Works with SDL's dummy audio driver (``SDL_AUDIODRIVER=dummy``).
     """
-    
-    def __init__(self):
-        """Initialize the sound manager and locate sound files."""
-        self.enabled = AUDIO_AVAILABLE
-        # Sound files should live alongside this module
-        self.sounds_dir = Path(__file__).parent / "sounds"
-
-        if self.enabled:
+
+    def __init__(self, fallback: Optional[Callable[[], None]] = None):
+        """Start loading the mixer in the background.
+
+        ``fallback`` is called instead of playing a sound when audio
+        isn't available; by default it rings the terminal bell.
+        """
+        self.enabled = False
+        self.fallback = fallback or self._bell
+        # Set once loading has finished, whether or not audio is available
+        self.ready = threading.Event()
+        # Synthesized sounds by (name, score)
+        self._sounds: Dict[Tuple[str, int], object] = {}
+        # (name, score) to play; None tells the thread to stop
+        self._requests: queue.SimpleQueue[Optional[Tuple[str, int]]] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="mood-tracker-audio", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        # Not self.enabled: close() may already have cleared that, and
+        # the thread should still work through what was queued
+        if not self._load_mixer():
+            return
+        # When each sound's last play ends, to spot stale clicks
+        playing_until: Dict[str, float] = {}
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            name = request[0]
+            now = time.monotonic()
+            if name == SELECT and now < playing_until.get(name, 0.0):
+                continue
             try:
-                # Initialize pygame mixer with minimal settings
-                # We only need the mixer, not the full pygame system
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                sound = self._sound(*request)
+                sound.play()
             except Exception:
-                self.enabled = False
-        
-    def play_selection(self) -> None:
+                # Silently fail - sounds are nice to have but not critical
+                continue
+            playing_until[name] = now + sound.get_length()
+
+    def _load_mixer(self) -> bool:
+        """Import pygame and open the mixer (runs on the background thread).
+
+        Returns whether audio is available.
+        """
+        global pygame, numpy
+        # pygame prints a banner on import; keep it off the UI's terminal
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        try:
+            # We'll handle the import gracefully in case the library isn't installed
+            import pygame.mixer  # type: ignore
+
+            # Initialize pygame mixer with minimal settings
+            # We only need the mixer, not the full pygame system
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            # The tones are 16-bit; play nothing rather than noise otherwise
+            enabled = self.enabled = pygame.mixer.get_init()[1] == -16
+            # pygame closes the mixer at exit; exit handlers run last
+            # registered first, so this stops our thread before that
+            atexit.register(self.close)
+        except Exception:
+            enabled = self.enabled = False
+        finally:
+            self.ready.set()
+        try:
+            import numpy  # type: ignore
+        except ImportError:
+            pass
+        return enabled
+
+    def _sound(self, name: str, score: int):
+        """The mixer sound for ``name`` at ``score``'s pitch, built on first use."""
+        sound = self._sounds.get((name, score))
+        if sound is None:
+            sample_rate, _, channels = pygame.mixer.get_init()
+            frequency = pitch_for_score(score)
+            if name == SELECT:
+                samples = synthesize_tone(frequency, SELECT_DURATION, sample_rate, channels)
+            else:
+                samples = array("h")
+                for semitones, duration in SAVE_NOTES:
+                    samples += synthesize_tone(
+                        frequency * 2 ** (semitones / 12), duration, sample_rate, channels
+                    )
+            # The mixer takes the samples through the buffer protocol: no
+            # WAV encoding and no file, just its own copy of the data
+            sound = self._sounds[(name, score)] = pygame.mixer.Sound(buffer=samples)
+        return sound
+
+    def play_selection(self, score: int = BASE_SCORE) -> None:
         """Play a sound when the user changes their mood selection.
-        
+
         This provides subtle audio feedback that helps make the interface
-        feel more responsive. The sound should be short and pleasant.
+        feel more responsive. The sound should be short and pleasant, and
+        higher for better moods.
         """
-        if not self.enabled:
-            # Fall back to the terminal bell if we can't play audio
-            print("\a", end="", flush=True)
-            return
-        
-        sound_file = self.sounds_dir / "select.wav"
-        self._play_sound(sound_file)
-    
-    def play_save(self) -> None:
+        self._play(SELECT, score)
+
+    def play_save(self, score: int = BASE_SCORE) -> None:
         """Play a confirmation sound when a mood is saved.
-        
+
         This sound should feel satisfying and conclusive, giving the
         user confidence that their entry was recorded successfully.
         """
+        self._play(SAVE, score)
+
+    def close(self) -> None:
+        """Stop the audio thread once it has worked through what was queued."""
+        self.enabled = False
+        self._requests.put(None)
+        self._thread.join(timeout=1)
+
+    def _play(self, name: str, score: int) -> None:
+        """Queue a sound for the audio thread; returns immediately."""
+        if not self.ready.is_set():
+            # Still loading; a late click is worse than none
+            return
         if not self.enabled:
-            print("\a", end="", flush=True)
+            # Fall back to the terminal bell if we can't play audio
+            self.fallback()
             return
-        
-        sound_file = self.sounds_dir / "save.wav"
-        self._play_sound(sound_file)
-    
-    def _play_sound(self, sound_file: Path) -> None:
-        """Internal method that handles the actual audio playback.
-
-        We wrap this in try-except because audio can fail for many reasons:
-        missing files, no audio device, permission issues, etc. The app
-        should never crash because of a sound effect.
-        """
-        try:
-            if sound_file.exists():
-                sound = pygame.mixer.Sound(str(sound_file))
-                sound.play()
-        except Exception:
-            # Silently fail - sounds are nice to have but not critical
-            pass
\ No newline at end of file
+        self._requests.put((name, score))
+
+    @staticmethod
+    def _bell() -> None:
+        print("\a", end="", flush=True)
@@ -5,3 +5,5 @@ MOOD_OPTIONS = [                      # Mood options as (label_for_ui, numeric_s
     (":(  Bad", 3),
     (":'( Awful", 1),
 ]
+
+RESIZE_DEBOUNCE = 1 / 60              # Seconds to wait for the last of a burst of resize events (about one frame)
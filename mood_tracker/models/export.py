@@ -2,21 +2,24 @@ from __future__ import annotations
 
 import csv
 import json
+import tempfile
+import textwrap
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Optional, Tuple
 
+from .rollups import Rollups
 from .storage import MoodEntry
 
 
-def export_to_csv(entries: List[MoodEntry], output_path: Path) -> None:
+def export_to_csv(entries: Iterable[MoodEntry], output_path: Path) -> None:
     """Export mood entries to a CSV file for spreadsheet analysis.
     
     CSV is perfect for opening in Excel, Google Sheets, or any data
     analysis tool. Each row represents one mood entry with all its fields.
     
     Args:
-        entries: List of mood entries to export
+        entries: Mood entries to export (any iterable, e.g. ``iter_moods()``)
         output_path: Where to write the CSV file
     """
     with output_path.open("w", newline="", encoding="utf-8") as csvfile:
@@ -37,109 +40,141 @@ def export_to_csv(entries: List[MoodEntry], output_path: Path) -> None:
             })
 
 
-def export_to_json(entries: List[MoodEntry], output_path: Path) -> None:
+def export_to_json(entries: Iterable[MoodEntry], output_path: Path) -> None:
     """Export mood entries to a JSON file for programmatic access.
     
     JSON preserves the full structure of your data and is easy to
     load back into Python or other programming languages. This is
     essentially a backup format that maintains all information.
     
+    Entries are written one at a time, so the output matches what
+    ``json.dump(..., indent=2)`` produces without building the whole
+    list in memory first.
+    
     Args:
-        entries: List of mood entries to export
+        entries: Mood entries to export (any iterable, e.g. ``iter_moods()``)
         output_path: Where to write the JSON file
     """
-    # Convert each entry to a dictionary using the existing method
-    data = [entry.to_dict() for entry in entries]
-    
-    # Write with nice formatting so humans can read it if needed
     with output_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        separator = "[\n"
+        for entry in entries:
+            # Indent each object one level so it nests inside the array
+            item = json.dumps(entry.to_dict(), indent=2, ensure_ascii=False)
+            f.write(separator + textwrap.indent(item, "  "))
+            separator = ",\n"
+        # An untouched separator means there were no entries at all
+        f.write("[]" if separator == "[\n" else "\n]")
 
 
-def export_to_markdown(entries: List[MoodEntry], output_path: Path) -> None:
+def export_to_markdown(
+    entries: Iterable[MoodEntry], output_path: Path, rollups: Optional[Rollups] = None
+) -> None:
     """Export mood entries to a Markdown file with visual mood graphs.
     
     Markdown creates a beautiful readable report that renders nicely
     on GitHub, in markdown viewers, or even printed to PDF. We organize
     entries by month and create visual bar charts using block characters.
     
+    The report needs its summary before the entries, but we only want
+    to walk the entries once. The numbers come from the store's
+    precomputed ``rollups`` when given (``load_rollups()``); otherwise
+    they are added up during the pass. Each entry's line goes to a
+    temporary spool file, remembering where every month's lines live;
+    then we write the summary and copy the months out of the spool,
+    newest first. Entries should arrive oldest first, which is the
+    order ``iter_moods()`` yields; a plain list is sorted for you.
+    
     Args:
-        entries: List of mood entries to export
+        entries: Mood entries to export (any iterable, e.g. ``iter_moods()``)
         output_path: Where to write the markdown file
+        rollups: Precomputed aggregates for the same entries, if available
     """
-    with output_path.open("w", encoding="utf-8") as f:
+    if isinstance(entries, list):
+        entries = sorted(entries, key=lambda e: e.epoch)
+
+    add_up = rollups is None
+    if add_up:
+        rollups = Rollups()
+    # (year, month) -> [(spool offset, length), ...]
+    by_month: Dict[Tuple[int, int], list] = {}
+
+    with tempfile.TemporaryFile() as spool, output_path.open("w", encoding="utf-8") as f:
+        for entry in entries:
+            if add_up:
+                rollups.add(entry)
+
+            timestamp = entry.timestamp
+            runs = by_month.setdefault((timestamp.year, timestamp.month), [])
+
+            block = _markdown_entry(entry, timestamp).encode("utf-8")
+            offset = spool.tell()
+            spool.write(block)
+            if runs and runs[-1][0] + runs[-1][1] == offset:
+                # Still contiguous with this month's previous lines
+                runs[-1] = (runs[-1][0], runs[-1][1] + len(block))
+            else:
+                runs.append((offset, len(block)))
+
         # Write the document header with generation timestamp
         f.write("# Mood Tracker Export\n\n")
         f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
         
-        if not entries:
+        overall = rollups.overall
+        if not by_month or not overall.count:
             f.write("No mood entries found.\n")
             return
         
-        # Calculate some overall statistics to show at the top
-        total_entries = len(entries)
-        average_mood = sum(e.score for e in entries) / total_entries
-        highest_mood = max(entries, key=lambda e: e.score)
-        lowest_mood = min(entries, key=lambda e: e.score)
+        # Overall statistics to show at the top
+        highest_day = rollups.first_day_of_highest()
+        lowest_day = rollups.first_day_of_lowest()
         
         f.write("## Summary Statistics\n\n")
-        f.write(f"- **Total entries:** {total_entries}\n")
-        f.write(f"- **Average mood:** {average_mood:.1f}/10\n")
-        f.write(f"- **Highest mood:** {highest_mood.score}/10 on {highest_mood.timestamp.strftime('%Y-%m-%d')}\n")
-        f.write(f"- **Lowest mood:** {lowest_mood.score}/10 on {lowest_mood.timestamp.strftime('%Y-%m-%d')}\n\n")
-        
-        # Group entries by month for better organization
-        by_month = {}
-        for entry in entries:
-            month_key = entry.timestamp.strftime("%Y-%m")
-            if month_key not in by_month:
-                by_month[month_key] = []
-            by_month[month_key].append(entry)
+        f.write(f"- **Total entries:** {overall.count}\n")
+        f.write(f"- **Average mood:** {overall.average:.1f}/10\n")
+        f.write(f"- **Highest mood:** {overall.highest}/10 on {highest_day.strftime('%Y-%m-%d')}\n")
+        f.write(f"- **Lowest mood:** {overall.lowest}/10 on {lowest_day.strftime('%Y-%m-%d')}\n\n")
         
         # Write each month as its own section
         f.write("## Monthly Breakdown\n\n")
-        for month_key in sorted(by_month.keys(), reverse=True):
-            month_entries = by_month[month_key]
-            month_name = datetime.strptime(month_key, "%Y-%m").strftime("%B %Y")
+        for year, month in sorted(by_month.keys(), reverse=True):
+            runs = by_month[(year, month)]
+            month_name = datetime(year, month, 1).strftime("%B %Y")
             
-            # Calculate month statistics
-            month_average = sum(e.score for e in month_entries) / len(month_entries)
+            # Month statistics come straight from the rollups
+            month_rollup = rollups.month(year, month)
             
             f.write(f"### {month_name}\n\n")
-            f.write(f"**Average mood:** {month_average:.1f}/10 ({len(month_entries)} entries)\n\n")
+            f.write(f"**Average mood:** {month_rollup.average:.1f}/10 ({month_rollup.count} entries)\n\n")
             
-            # Write each entry with a visual bar
-            for entry in sorted(month_entries, key=lambda e: e.timestamp):
-                date_str = entry.timestamp.strftime("%Y-%m-%d")
-                time_str = entry.timestamp.strftime("%H:%M")
-                
-                # Create a visual bar using block characters
-                # Each block represents one point on the 1-10 scale
-                bar = "█" * entry.score
-                
-                # Choose an emoji based on the score for quick visual scanning
-                if entry.score >= 8:
-                    emoji = "😄"
-                elif entry.score >= 6:
-                    emoji = "🙂"
-                elif entry.score >= 4:
-                    emoji = "😐"
-                elif entry.score >= 2:
-                    emoji = "😕"
-                else:
-                    emoji = "😢"
-                
-                f.write(f"- **{date_str}** at {time_str} {emoji} `{bar}` ({entry.score}/10)")
-                
-                # Include the note if one was provided
-                if entry.note:
-                    f.write(f"\n  > {entry.note}")
-                
-                f.write("\n")
+            # Copy this month's entry lines back out of the spool
+            for offset, length in runs:
+                spool.seek(offset)
+                f.write(spool.read(length).decode("utf-8"))
             
             f.write("\n")
 
 
+def _markdown_entry(entry: MoodEntry, timestamp: datetime) -> str:
+    """Format one entry as a markdown list item with a visual bar."""
+    date_str = timestamp.strftime("%Y-%m-%d")
+    time_str = timestamp.strftime("%H:%M")
+    
+    # Create a visual bar using block characters
+    # Each block represents one point on the 1-10 scale
+    bar = "█" * entry.score
+    
+    # Choose an emoji based on the score for quick visual scanning
+    emoji = _mood_emoji(entry.score)
+    
+    line = f"- **{date_str}** at {time_str} {emoji} `{bar}` ({entry.score}/10)"
+    
+    # Include the note if one was provided
+    if entry.note:
+        line += f"\n  > {entry.note}"
+    
+    return line + "\n"
+
+
 def _mood_emoji(score: int) -> str:
     """Helper function to get an emoji representation of a mood score.
     
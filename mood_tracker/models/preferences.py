@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass, asdict
 from pathlib import Path
+import atexit
 import json
-from typing import Any
+import threading
+import time
+from typing import Any, Optional
 
 from .storage import DATA_PATH
+from .writer import WriteBehindWriter, writer
 
 PREFERENCES_FILE = DATA_PATH / "preferences.json"
+# Seconds to wait after the last change before writing, so holding an
+# arrow key saves once instead of on every step
+SAVE_DELAY = 0.5
 
 
 @dataclass
@@ -27,23 +35,106 @@ class UserPreferences:
         return cls(**data)
 
 
+class PreferencesStore:
+    """User preferences kept in memory and written to disk behind the UI.
+
+    ``save`` only notes that the preferences changed and pushes back a
+    short deadline. When the deadline passes, a timer thread serializes
+    the current preferences once and hands them to the writer, which
+    replaces the file atomically. Changes in quick succession therefore
+    cost a single write, and anything still pending is written at exit.
+    """
+
+    def __init__(
+        self,
+        path: Path = PREFERENCES_FILE,
+        delay: float = SAVE_DELAY,
+        writer: WriteBehindWriter = writer,
+    ) -> None:
+        self.path = path
+        self.delay = delay
+        self._writer = writer
+        self._preferences: Optional[UserPreferences] = None
+        self._lock = threading.Lock()
+        # When the pending changes are due to be written (None if none are)
+        self._due: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        # Registered after the writer's own exit handler, so it runs first
+        atexit.register(self.flush)
+
+    def load(self) -> UserPreferences:
+        """The preferences, read from disk the first time they're needed."""
+        if self._preferences is None:
+            self._preferences = self._read()
+        return self._preferences
+
+    def save(self, prefs: Optional[UserPreferences] = None) -> None:
+        """Schedule a write of ``prefs`` (by default the loaded preferences)."""
+        with self._lock:
+            if prefs is not None:
+                self._preferences = prefs
+            self._due = time.monotonic() + self.delay
+            # One timer per burst of changes; it re-arms itself if the
+            # deadline moved while it was waiting
+            if self._timer is None:
+                self._start_timer(self.delay)
+
+    def flush(self) -> Future:
+        """Write pending changes now; the future resolves once they're durable."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._due is None or self._preferences is None:
+                done: Future = Future()
+                done.set_result(None)
+                return done
+            self._due = None
+            text = json.dumps(self._preferences.to_dict(), indent=2)
+        return self._writer.replace(self.path, text)
+
+    def _start_timer(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._due is None:
+                return
+            remaining = self._due - time.monotonic()
+            if remaining > 0:
+                self._start_timer(remaining)
+                return
+        self.flush()
+
+    def _read(self) -> UserPreferences:
+        # Make sure a save that's still queued is on disk before we read
+        self._writer.flush()
+        if not self.path.exists():
+            return UserPreferences()
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return UserPreferences.from_dict(data)
+        except (json.JSONDecodeError, TypeError, KeyError):
+            # If the file is corrupted, return defaults
+            return UserPreferences()
+
+
+# Shared by everything that reads or changes preferences
+preferences_store = PreferencesStore()
+
+
 def load_preferences() -> UserPreferences:
-    """Load user preferences from disk, or return defaults if file doesn't exist."""
-    if not PREFERENCES_FILE.exists():
-        return UserPreferences()
-    
-    try:
-        data = json.loads(PREFERENCES_FILE.read_text(encoding="utf-8"))
-        return UserPreferences.from_dict(data)
-    except (json.JSONDecodeError, TypeError, KeyError):
-        # If the file is corrupted, return defaults
-        return UserPreferences()
+    """Return the user's preferences (loaded from disk on first use)."""
+    return preferences_store.load()
 
 
 def save_preferences(prefs: UserPreferences) -> None:
-    """Save user preferences to disk."""
-    DATA_PATH.mkdir(parents=True, exist_ok=True)
-    PREFERENCES_FILE.write_text(
-        json.dumps(prefs.to_dict(), indent=2),
-        encoding="utf-8"
-    )
\ No newline at end of file
+    """Save user preferences to disk shortly, in the background.
+
+    Saves in quick succession are coalesced into one write; call
+    ``preferences_store.flush()`` to write immediately.
+    """
+    preferences_store.save(prefs)
@@ -0,0 +1,265 @@
+"""Per-day and per-month mood aggregates, kept up to date as moods are logged.
+
+Footers, stats panels, the calendar and exports all want the same few
+numbers: how many entries, their average, lowest and highest score,
+and which score comes up most. Instead of rescanning the history for
+each of them, the repository keeps a ``Rollups`` object next to its
+cache. Logging a mood updates one day and one month bucket, plus the
+streak trackers, in constant time, and the shard store saves the
+rollups with every snapshot so startup only has to add in the short
+journal tail.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .storage import MoodEntry
+
+# Scores run from 1 to 10; the histogram has one bucket per score
+LOWEST_SCORE = 1
+HIGHEST_SCORE = 10
+
+_EPOCH_DAY = date(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+_ONE_DAY = timedelta(days=1)
+
+
+def day_of(epoch: int) -> date:
+    """The (local) calendar day an epoch-second timestamp falls on."""
+    return _EPOCH_DAY + timedelta(days=epoch // _SECONDS_PER_DAY)
+
+
+class Rollup:
+    """Count, sum, min, max and a score histogram for one bucket of entries."""
+
+    __slots__ = ("count", "total", "lowest", "highest", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.lowest: Optional[int] = None
+        self.highest: Optional[int] = None
+        self.histogram = [0] * (HIGHEST_SCORE - LOWEST_SCORE + 1)
+
+    def add(self, score: int, times: int = 1) -> None:
+        """Count ``score`` (``times`` times over)."""
+        self.count += times
+        self.total += score * times
+        if self.lowest is None or score < self.lowest:
+            self.lowest = score
+        if self.highest is None or score > self.highest:
+            self.highest = score
+        if LOWEST_SCORE <= score <= HIGHEST_SCORE:
+            self.histogram[score - LOWEST_SCORE] += times
+
+    def merge(self, other: "Rollup") -> None:
+        """Fold ``other`` into this rollup."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        if self.lowest is None or other.lowest < self.lowest:
+            self.lowest = other.lowest
+        if self.highest is None or other.highest > self.highest:
+            self.highest = other.highest
+        for index, times in enumerate(other.histogram):
+            self.histogram[index] += times
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def mode(self) -> Optional[int]:
+        """The most frequent score (the lowest one on a tie)."""
+        if not any(self.histogram):
+            return None
+        most = max(self.histogram)
+        return self.histogram.index(most) + LOWEST_SCORE
+
+    def to_json(self) -> List[Any]:
+        return [self.count, self.total, self.lowest, self.highest, self.histogram]
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "Rollup":
+        rollup = cls()
+        rollup.count, rollup.total, rollup.lowest, rollup.highest, histogram = data
+        rollup.histogram = list(histogram)
+        return rollup
+
+
+# Which days count towards each kind of streak, judged on the whole day
+# so several entries on one date still make a single streak day
+STREAK_RULES: Dict[str, Callable[[Rollup], bool]] = {
+    "above_meh": lambda day: day.average > 5,  # the day averaged better than Meh
+    "any": lambda day: day.count > 0,  # something was logged that day
+}
+
+
+class StreakTracker:
+    """Current and longest run of consecutive qualifying days for one rule.
+
+    Fed one day at a time as entries are added. Moods logged in order
+    (the normal case) only extend or restart the latest run; an entry
+    for an older day, or one that drags the latest day below the bar,
+    is rare enough that we just rebuild from the day rollups.
+    """
+
+    __slots__ = ("qualifies", "run_end", "run_length", "longest_before")
+
+    def __init__(self, qualifies: Callable[[Rollup], bool]) -> None:
+        self.qualifies = qualifies
+        self.run_end: Optional[date] = None
+        self.run_length = 0
+        # Longest run that ended before the latest one
+        self.longest_before = 0
+
+    def current(self, today: date) -> int:
+        """Length of the streak that includes ``today`` (0 if today doesn't count yet)."""
+        return self.run_length if self.run_end == today else 0
+
+    @property
+    def longest(self) -> int:
+        return max(self.longest_before, self.run_length)
+
+    def update(self, day: date, days: Dict[date, Rollup]) -> None:
+        """Account for ``day``'s rollup having changed."""
+        end = self.run_end
+        if end is not None and day <= end:
+            if day < end or not self.qualifies(days[day]):
+                self.rebuild(days)
+            return
+        if not self.qualifies(days[day]):
+            return
+        if end is not None and day == end + _ONE_DAY:
+            self.run_length += 1
+        else:
+            self.longest_before = self.longest
+            self.run_length = 1
+        self.run_end = day
+
+    def rebuild(self, days: Dict[date, Rollup]) -> None:
+        """Recompute the runs from scratch."""
+        self.run_end = None
+        self.run_length = self.longest_before = 0
+        for day in sorted(days):
+            if not self.qualifies(days[day]):
+                continue
+            if self.run_end is not None and day == self.run_end + _ONE_DAY:
+                self.run_length += 1
+            else:
+                self.longest_before = self.longest
+                self.run_length = 1
+            self.run_end = day
+
+    def to_json(self) -> List[Any]:
+        run_end = self.run_end.isoformat() if self.run_end else None
+        return [run_end, self.run_length, self.longest_before]
+
+    def load_json(self, data: List[Any]) -> None:
+        run_end, self.run_length, self.longest_before = data
+        self.run_end = date.fromisoformat(run_end) if run_end else None
+
+
+class Rollups:
+    """Rollups for every day and month of a history, plus the whole thing.
+
+    Treat what the accessors return as read-only; days and months that
+    have no entries come back as an empty ``Rollup``.
+    """
+
+    def __init__(self) -> None:
+        self.days: Dict[date, Rollup] = {}
+        self.months: Dict[Tuple[int, int], Rollup] = {}
+        self.overall = Rollup()
+        self.streaks = {name: StreakTracker(rule) for name, rule in STREAK_RULES.items()}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable["MoodEntry"]) -> "Rollups":
+        rollups = cls()
+        for entry in entries:
+            rollups._add(day_of(entry.epoch), entry.score, 1)
+        rollups._rebuild_streaks()
+        return rollups
+
+    @classmethod
+    def from_day_scores(cls, rows: Iterable[Tuple[date, int, int]]) -> "Rollups":
+        """Build from ``(day, score, how many times)`` rows in any order."""
+        rollups = cls()
+        for day, score, times in rows:
+            rollups._add(day, score, times)
+        rollups._rebuild_streaks()
+        return rollups
+
+    def add(self, entry: "MoodEntry") -> None:
+        """Account for one newly stored entry in constant time."""
+        self.add_score(day_of(entry.epoch), entry.score)
+
+    def add_score(self, day: date, score: int, times: int = 1) -> None:
+        self._add(day, score, times)
+        for tracker in self.streaks.values():
+            tracker.update(day, self.days)
+
+    def _rebuild_streaks(self) -> None:
+        for tracker in self.streaks.values():
+            tracker.rebuild(self.days)
+
+    def _add(self, day: date, score: int, times: int) -> None:
+        rollup = self.days.get(day)
+        if rollup is None:
+            rollup = self.days[day] = Rollup()
+        rollup.add(score, times)
+        month = self.months.get((day.year, day.month))
+        if month is None:
+            month = self.months[(day.year, day.month)] = Rollup()
+        month.add(score, times)
+        self.overall.add(score, times)
+
+    def day(self, day: date) -> Rollup:
+        return self.days.get(day) or Rollup()
+
+    def month(self, year: int, month: int) -> Rollup:
+        return self.months.get((year, month)) or Rollup()
+
+    def first_day_of_highest(self) -> Optional[date]:
+        """The earliest day with an entry at the overall highest score."""
+        highest = self.overall.highest
+        return min((day for day, r in self.days.items() if r.highest == highest), default=None)
+
+    def first_day_of_lowest(self) -> Optional[date]:
+        """The earliest day with an entry at the overall lowest score."""
+        lowest = self.overall.lowest
+        return min((day for day, r in self.days.items() if r.lowest == lowest), default=None)
+
+    def to_json(self) -> Dict[str, Any]:
+        # Months and the overall rollup are rebuilt from the days on load
+        return {
+            "version": 1,
+            "days": {
+                day.isoformat(): rollup.to_json() for day, rollup in sorted(self.days.items())
+            },
+            "streaks": {name: tracker.to_json() for name, tracker in self.streaks.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Rollups":
+        rollups = cls()
+        for key, value in data["days"].items():
+            day = date.fromisoformat(key)
+            rollup = rollups.days[day] = Rollup.from_json(value)
+            month = rollups.months.get((day.year, day.month))
+            if month is None:
+                month = rollups.months[(day.year, day.month)] = Rollup()
+            month.merge(rollup)
+            rollups.overall.merge(rollup)
+        saved = data.get("streaks", {})
+        for name, tracker in rollups.streaks.items():
+            if name in saved:
+                tracker.load_json(saved[name])
+            else:
+                # Saved before this rule existed
+                tracker.rebuild(rollups.days)
+        return rollups
@@ -1,21 +1,131 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+import asyncio
+import bisect
+import heapq
 import json
-from typing import List, Dict, Any
+import os
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import Future
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
+
+from .rollups import Rollups, day_of
+from .writer import WriteBehindWriter, atomic_write_text, gather, writer as default_writer
 
 DATA_PATH = Path.home() / ".mood_tracker"
+# Legacy storage: a single JSON array rewritten on every save
 DATA_FILE = DATA_PATH / "moods.json"
+# Previous storage: a single append-only journal, one JSON object per line
+JOURNAL_FILE = DATA_PATH / "moods.jsonl"
+# Current storage: one append-only journal per month plus a manifest
+SHARD_DIR = DATA_PATH / "moods"
+MANIFEST_FILE = SHARD_DIR / "manifest.json"
+# Optional SQLite store, used instead of the journal once it exists
+DB_FILE = DATA_PATH / "moods.db"
+
+# Timestamps are naive local times; the database stores them as seconds
+# since this naive epoch so they round-trip without timezone guessing
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch(moment: datetime) -> int:
+    """Convert a timestamp to whole seconds since the naive epoch."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return (moment - _EPOCH) // timedelta(seconds=1)
+
+
+def _from_epoch(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _epoch_bound(moment: datetime) -> int:
+    """The smallest epoch second at or after ``moment``.
+
+    Entries with ``timestamp >= moment`` are exactly those whose epoch
+    is ``>= _epoch_bound(moment)``, and likewise for ``<``, so range
+    bounds with sub-second precision still split entries correctly.
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return -((_EPOCH - moment) // timedelta(seconds=1))
+
+
+def _entry_epoch(entry: MoodEntry) -> int:
+    return entry.epoch
+
+
+def _limited(entries: List[MoodEntry], limit: Optional[int], reverse: bool) -> List[MoodEntry]:
+    """Apply query_range's ``reverse`` and ``limit`` to oldest-first ``entries``."""
+    if reverse:
+        entries.reverse()
+    return entries if limit is None else entries[:max(limit, 0)]
 
 
-@dataclass
 class MoodEntry:
-    timestamp: datetime
-    score: int             # 1–10
-    tag: str | None = None
-    note: str | None = None
+    """A single logged mood.
+
+    Long histories are held in memory in full, so entries are kept lean:
+    no per-instance ``__dict__``, the timestamp stored as whole epoch
+    seconds instead of a ``datetime`` object, and tags interned so that
+    thousands of entries tagged "work" share one string. ``timestamp``
+    is still available as a ``datetime`` property.
+    """
+
+    __slots__ = ("epoch", "score", "tag", "note")
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        score: int,             # 1–10
+        tag: str | None = None,
+        note: str | None = None,
+    ) -> None:
+        self.epoch = _to_epoch(timestamp)
+        self.score = score
+        self.tag = sys.intern(tag) if tag else tag
+        self.note = note
+
+    @classmethod
+    def from_epoch(
+        cls, epoch: int, score: int, tag: str | None = None, note: str | None = None
+    ) -> "MoodEntry":
+        """Build an entry straight from epoch seconds, skipping the datetime."""
+        entry = cls.__new__(cls)
+        entry.epoch = epoch
+        entry.score = score
+        entry.tag = sys.intern(tag) if tag else tag
+        entry.note = note
+        return entry
+
+    @property
+    def timestamp(self) -> datetime:
+        return _from_epoch(self.epoch)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.epoch = _to_epoch(value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoodEntry):
+            return NotImplemented
+        return (self.epoch, self.score, self.tag, self.note) == (
+            other.epoch, other.score, other.tag, other.note
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"MoodEntry(timestamp={self.timestamp!r}, score={self.score!r}, "
+            f"tag={self.tag!r}, note={self.note!r})"
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -35,32 +145,1088 @@ class MoodEntry:
         )
 
 
-def init_storage() -> None:
-    """Ensure data folder/file exist."""
-    DATA_PATH.mkdir(parents=True, exist_ok=True)
-    if not DATA_FILE.exists():
-        DATA_FILE.write_text("[]", encoding="utf-8")
+def _encode_line(entry: MoodEntry) -> str:
+    """Serialize one entry as a single journal line (newline included)."""
+    return json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
 
 
-def load_moods() -> List[MoodEntry]:
-    """Load moods with gentle validation to handle corrupted data."""
-    init_storage()
-    raw = json.loads(DATA_FILE.read_text(encoding="utf-8"))
-    
-    entries = []
-    for item in raw:
+def _iter_legacy_array(path: Path) -> Iterator[MoodEntry]:
+    """Yield entries from the original single JSON array file."""
+    for item in json.loads(path.read_text(encoding="utf-8") or "[]"):
         try:
-            entries.append(MoodEntry.from_dict(item))
+            yield MoodEntry.from_dict(item)
         except (ValueError, KeyError, TypeError) as e:
-            # Skip corrupted entries silently
             print(f"⚠️  Skipping corrupted entry: {e}")
-            continue
-    
-    return entries
 
 
-def save_moods(entries: List[MoodEntry]) -> None:
-    """Save moods with consistent ISO format."""
-    init_storage()
-    payload = [entry.to_dict() for entry in entries]
-    DATA_FILE.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+def _read_legacy(path: Path) -> List[MoodEntry]:
+    """Entries from an older single-file store: a journal or the original JSON array."""
+    if path.suffix == ".jsonl":
+        return _read_journal(path)
+    return list(_iter_legacy_array(path))
+
+
+def _decode_line(raw: bytes) -> MoodEntry:
+    """Parse one stored line: a journal dict or a compact snapshot row."""
+    data = json.loads(raw)
+    if isinstance(data, list):
+        epoch, score, tag, note = data
+        return MoodEntry.from_epoch(int(epoch), int(score), tag, note)
+    return MoodEntry.from_dict(data)
+
+
+def _encode_row(entry: MoodEntry) -> str:
+    """Serialize one entry as a compact snapshot row (newline included)."""
+    return json.dumps([entry.epoch, entry.score, entry.tag, entry.note], ensure_ascii=False) + "\n"
+
+
+def _iter_journal(path: Path, offset: int = 0) -> Iterator[MoodEntry]:
+    """Yield entries from the journal one line at a time.
+
+    Only the bytes present when iteration starts are read, so an entry
+    being appended concurrently is never seen half-written. Reading
+    starts at byte ``offset``. Corrupted lines are skipped.
+    """
+    with path.open("rb") as f:
+        remaining = os.fstat(f.fileno()).st_size - offset
+        f.seek(offset)
+        for raw in f:
+            remaining -= len(raw)
+            if remaining < 0:
+                break
+            if not raw.strip():
+                continue
+            try:
+                yield _decode_line(raw)
+            except (ValueError, KeyError, TypeError) as e:
+                # Skip corrupted entries (e.g. a line cut short by a crash)
+                print(f"⚠️  Skipping corrupted entry: {e}")
+                continue
+
+
+def _read_journal(path: Path) -> List[MoodEntry]:
+    """Parse every line of the journal, skipping anything corrupted."""
+    return list(_iter_journal(path))
+
+
+def _in_range(entry: MoodEntry, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """Whether ``entry`` falls in the half-open range [start, end)."""
+    if start is not None and entry.timestamp < start:
+        return False
+    if end is not None and entry.timestamp >= end:
+        return False
+    return True
+
+
+class StorageBackend:
+    """Interface shared by the places mood entries can live.
+
+    ``signature`` returns a cheap token that changes whenever the stored
+    data changes outside this process; the repository compares it to
+    decide whether its cache is still good. Backends with ``indexed``
+    set can answer range queries without loading every entry, so while
+    its cache is cold the repository asks them directly for small
+    queries instead of loading everything.
+    """
+
+    indexed = False
+
+    def ensure(self) -> None:
+        """Create whatever files the backend needs."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Wait until every queued write has reached the disk."""
+        self.writer.flush()
+
+    def signature(self) -> Optional[Any]:
+        raise NotImplementedError
+
+    def load_all(self) -> List[MoodEntry]:
+        raise NotImplementedError
+
+    def iter_all(self) -> Iterator[MoodEntry]:
+        """Yield every entry without building the full list first."""
+        return iter(self.load_all())
+
+    def append(self, entry: MoodEntry) -> Future:
+        """Queue ``entry`` for writing; the future resolves once it's durable."""
+        raise NotImplementedError
+
+    def replace_all(self, entries: List[MoodEntry]) -> Future:
+        raise NotImplementedError
+
+    def query_range(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+        reverse: bool = False,
+    ) -> List[MoodEntry]:
+        """Entries in ``[start, end)`` by time, newest first with ``reverse``.
+
+        ``limit`` keeps only the first that many of that ordering.
+        """
+        entries = [entry for entry in self.load_all() if _in_range(entry, start, end)]
+        entries.sort(key=_entry_epoch)
+        return _limited(entries, limit, reverse)
+
+    def load_rollups(self) -> Rollups:
+        """Day and month rollups for everything stored."""
+        return Rollups.from_entries(self.iter_all())
+
+
+def _month_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m")
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+# Journal entries beyond this many get folded into the snapshot
+COMPACT_THRESHOLD = 500
+
+
+class ShardedBackend(StorageBackend):
+    """Monthly snapshot files plus a short tail journal, tied together by a manifest.
+
+    Each month has a snapshot (``moods/2026-10.<generation>.jsonl``)
+    holding its entries sorted by time as compact ``[epoch, score, tag,
+    note]`` rows. Snapshots are never edited in place: compaction writes
+    new files and switches the manifest over to them.
+
+    New entries are only appended to ``moods/journal.jsonl``. Once the
+    journal passes ``compact_threshold`` entries, a compaction on the
+    writer thread folds it into the month snapshots and empties it, so
+    startup reads the snapshots and replays at most a few hundred lines
+    no matter how long the history is.
+
+    ``manifest.json`` lists every month's snapshot file, so month views,
+    date ranges and "the latest few entries" only open the files they
+    need, and names the saved rollups, which hold the aggregates. It
+    also records how many journal bytes are already part of the
+    snapshot; compaction and ``replace_all`` write that before emptying
+    the journal, so a crash halfway through never replays an entry
+    twice.
+    """
+
+    indexed = True
+
+    def __init__(
+        self,
+        directory: Path,
+        writer: WriteBehindWriter = default_writer,
+        compact_threshold: int = COMPACT_THRESHOLD,
+        legacy_sources: Sequence[Path] = (),
+    ) -> None:
+        self.directory = directory
+        self.manifest_path = directory / "manifest.json"
+        self.journal_path = directory / "journal.jsonl"
+        self.writer = writer
+        self.compact_threshold = compact_threshold
+        # Older single-file stores to split into shards when starting afresh
+        self.legacy_sources = legacy_sources
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_signature: Optional[Tuple[int, int, int]] = None
+        self._tail: List[MoodEntry] = []
+        self._tail_key: Optional[Tuple[Any, int]] = None
+        self._tail_count: Optional[int] = None
+
+    def _shard_path(self, key: str, shards: Dict[str, Dict[str, Any]]) -> Path:
+        # Shards from before compaction existed have no "file" entry
+        return self.directory / shards[key].get("file", f"{key}.jsonl")
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Read the manifest straight from disk."""
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            data = {"version": 2, "shards": {}}
+        data.setdefault("generation", 0)
+        data.setdefault("journal_offset", 0)
+        return data
+
+    def _manifest_text(
+        self,
+        shards: Dict[str, Dict[str, Any]],
+        generation: int,
+        journal_offset: int,
+        rollups: Optional[str],
+    ) -> str:
+        payload = {
+            "version": 2,
+            "generation": generation,
+            "journal_offset": journal_offset,
+            "rollups": rollups,
+            "shards": dict(sorted(shards.items())),
+        }
+        return json.dumps(payload, indent=2)
+
+    def _read_rollups(self, manifest: Dict[str, Any]) -> Optional[Rollups]:
+        """The rollups saved with the snapshot, or None if there aren't usable ones."""
+        name = manifest.get("rollups")
+        if not name:
+            return None
+        try:
+            data = json.loads((self.directory / name).read_text(encoding="utf-8"))
+            return Rollups.from_json(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_rollups(self, generation: int, rollups: Rollups) -> str:
+        name = f"rollups.{generation}.json"
+        atomic_write_text(self.directory / name, json.dumps(rollups.to_json()))
+        return name
+
+    def _write_snapshot(
+        self, key: str, generation: int, entries: List[MoodEntry]
+    ) -> Dict[str, Any]:
+        """Write one month's sorted snapshot under a fresh name; return its manifest info."""
+        info = {"file": f"{key}.{generation}.jsonl"}
+        atomic_write_text(self.directory / info["file"], "".join(_encode_row(e) for e in entries))
+        return info
+
+    def _remove_unreferenced(self, shards: Dict[str, Dict[str, Any]], rollups: str) -> None:
+        """Delete snapshot and rollup files the manifest no longer points at."""
+        keep = {self._shard_path(key, shards).name for key in shards}
+        keep.update((self.journal_path.name, rollups))
+        for pattern in ("*.jsonl", "rollups.*.json"):
+            for path in self.directory.glob(pattern):
+                if path.name not in keep:
+                    path.unlink(missing_ok=True)
+
+    def _state(self) -> Tuple[Dict[str, Dict[str, Any]], List[MoodEntry]]:
+        """The snapshot shards and the journal tail, once queued writes have landed.
+
+        Both are cached and only re-read when their files change.
+        """
+        self.writer.flush()
+        signature = _stat_signature(self.manifest_path)
+        if self._manifest is None or signature != self._manifest_signature:
+            self._manifest, self._manifest_signature = self._load_manifest(), signature
+        tail_key = (_stat_signature(self.journal_path), self._manifest["journal_offset"])
+        if tail_key != self._tail_key:
+            tail = (
+                list(_iter_journal(self.journal_path, tail_key[1]))
+                if tail_key[0] is not None
+                else []
+            )
+            # Imports may arrive out of order; keep the tail sorted like the shards
+            tail.sort(key=_entry_epoch)
+            self._tail, self._tail_key = tail, tail_key
+        return self._manifest["shards"], self._tail
+
+    def _read_shard(self, key: str, shards: Dict[str, Dict[str, Any]]) -> Iterator[MoodEntry]:
+        self.writer.flush()
+        return _iter_journal(self._shard_path(key, shards))
+
+    def _keys_between(
+        self,
+        shards: Dict[str, Dict[str, Any]],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> List[str]:
+        """Shard keys that can hold entries in ``[start, end)``, oldest first."""
+        first = _month_key(start) if start is not None else None
+        # ``end`` is exclusive, so a range ending at midnight on the 1st
+        # doesn't need that month's shard
+        last = _month_key(end - timedelta(microseconds=1)) if end is not None else None
+        return [
+            key
+            for key in sorted(shards)
+            if (first is None or key >= first) and (last is None or key <= last)
+        ]
+
+    def _iter_month(
+        self, key: str, shards: Dict[str, Dict[str, Any]], tail: List[MoodEntry]
+    ) -> Iterator[MoodEntry]:
+        """One month's entries in time order, snapshot and journal combined."""
+        pending = [entry for entry in tail if _month_key(entry.timestamp) == key]
+        snapshot = self._read_shard(key, shards) if key in shards else iter(())
+        return heapq.merge(snapshot, pending, key=_entry_epoch)
+
+    def _months(
+        self,
+        shards: Dict[str, Dict[str, Any]],
+        tail: List[MoodEntry],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[str]:
+        """Month keys with entries (in the snapshot or the journal) in ``[start, end)``."""
+        keys = set(self._keys_between(shards, start, end))
+        keys.update(
+            _month_key(entry.timestamp) for entry in tail if _in_range(entry, start, end)
+        )
+        return sorted(keys)
+
+    def ensure(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self.manifest_path.exists():
+            self._adopt_legacy()
+        self.writer.flush()
+        manifest = self._load_manifest()
+        if manifest.get("version", 1) < 2:
+            # Shards written before compaction existed: sort them once
+            self.writer.call(lambda: self._compact(rebuild=True)).result()
+        elif _file_size(self.journal_path) < manifest["journal_offset"]:
+            # A compaction emptied the journal but didn't get to reset the offset
+            text = self._manifest_text(
+                manifest["shards"], manifest["generation"], 0, manifest.get("rollups")
+            )
+            self.writer.replace(self.manifest_path, text).result()
+        _, tail = self._state()
+        self._tail_count = len(tail)
+        if self._tail_count >= self.compact_threshold:
+            self.compact()
+
+    def _adopt_legacy(self) -> None:
+        """Start the store, splitting the first legacy file found into shards.
+
+        The manifest is written last, so an interrupted migration simply
+        runs again next launch; the old file is then kept with a
+        ``.migrated`` suffix.
+        """
+        source = next((path for path in self.legacy_sources if path.exists()), None)
+        entries = _read_legacy(source) if source is not None else []
+        # Wait for the shards to be durable before retiring the old file
+        self.replace_all(entries).result()
+        if source is not None:
+            source.replace(source.with_name(source.name + ".migrated"))
+
+    def signature(self) -> Optional[Tuple[Any, Any]]:
+        manifest = _stat_signature(self.manifest_path)
+        if manifest is None:
+            return None
+        return (manifest, _stat_signature(self.journal_path))
+
+    def iter_all(self) -> Iterator[MoodEntry]:
+        shards, tail = self._state()
+        for key in self._months(shards, tail):
+            yield from self._iter_month(key, shards, tail)
+
+    def load_all(self) -> List[MoodEntry]:
+        return list(self.iter_all())
+
+    def load_rollups(self) -> Rollups:
+        # The snapshot's rollups plus whatever the journal added since
+        _, tail = self._state()
+        rollups = self._read_rollups(self._manifest)
+        if rollups is None:
+            return super().load_rollups()
+        for entry in tail:
+            rollups.add(entry)
+        return rollups
+
+    def append(self, entry: MoodEntry) -> Future:
+        if self._tail_count is None:
+            self._tail_count = len(self._state()[1])
+        future = self.writer.append(self.journal_path, _encode_line(entry).encode("utf-8"))
+        self._tail_count += 1
+        if self._tail_count >= self.compact_threshold:
+            return gather([future, self.compact()])
+        return future
+
+    def compact(self) -> Future:
+        """Queue folding the journal into the month snapshots."""
+        self._tail_count = 0
+        return self.writer.call(self._compact)
+
+    def _compact(self, rebuild: bool = False) -> None:
+        """Fold the journal into the snapshots. Runs on the writer thread.
+
+        With ``rebuild`` every shard is rewritten, not just the months
+        the journal touches (used to upgrade shards from older versions).
+        """
+        manifest = self._load_manifest()
+        shards = dict(manifest["shards"])
+        generation = manifest["generation"] + 1
+        journal_size = _file_size(self.journal_path)
+        offset = manifest["journal_offset"] if journal_size >= manifest["journal_offset"] else 0
+
+        by_month: Dict[str, List[MoodEntry]] = {}
+        if journal_size:
+            for entry in _iter_journal(self.journal_path, offset):
+                by_month.setdefault(_month_key(entry.timestamp), []).append(entry)
+
+        # New snapshots get new file names, so until the manifest below is
+        # renamed into place the old ones are still what everyone reads
+        for key in sorted(set(by_month) | (set(shards) if rebuild else set())):
+            month = list(_iter_journal(self._shard_path(key, shards))) if key in shards else []
+            month.extend(by_month.get(key, ()))
+            month.sort(key=_entry_epoch)
+            if month:
+                shards[key] = self._write_snapshot(key, generation, month)
+            else:
+                shards.pop(key, None)
+
+        rollups = None if rebuild else self._read_rollups(manifest)
+        if rollups is None:
+            rollups = Rollups.from_entries(
+                entry
+                for key in sorted(shards)
+                for entry in _iter_journal(self._shard_path(key, shards))
+            )
+        else:
+            for month_entries in by_month.values():
+                for entry in month_entries:
+                    rollups.add(entry)
+        rollups_file = self._write_rollups(generation, rollups)
+        self._commit(shards, generation, rollups_file, journal_size)
+
+    def _commit(
+        self,
+        shards: Dict[str, Dict[str, Any]],
+        generation: int,
+        rollups_file: str,
+        journal_size: int,
+    ) -> None:
+        """Switch over to new snapshots that absorbed the first ``journal_size`` journal bytes.
+
+        The manifest is the commit point: once it says the journal is
+        folded in, a crash before the journal is emptied can't replay it.
+        """
+        atomic_write_text(
+            self.manifest_path,
+            self._manifest_text(shards, generation, journal_size, rollups_file),
+        )
+        self._remove_unreferenced(shards, rollups_file)
+        if journal_size:
+            atomic_write_text(self.journal_path, "")
+            atomic_write_text(
+                self.manifest_path, self._manifest_text(shards, generation, 0, rollups_file)
+            )
+
+    def replace_all(self, entries: List[MoodEntry]) -> Future:
+        by_month: Dict[str, List[MoodEntry]] = {}
+        for entry in sorted(entries, key=_entry_epoch):
+            by_month.setdefault(_month_key(entry.timestamp), []).append(entry)
+
+        def rewrite() -> None:
+            generation = self._load_manifest()["generation"] + 1
+            shards = {
+                key: self._write_snapshot(key, generation, month_entries)
+                for key, month_entries in by_month.items()
+            }
+            rollups_file = self._write_rollups(generation, Rollups.from_entries(entries))
+            # Whatever the journal held was replaced too, so the new
+            # snapshots count as having absorbed all of it
+            self._commit(shards, generation, rollups_file, _file_size(self.journal_path))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._tail_count = 0
+        return self.writer.call(rewrite)
+
+    def query_range(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+        reverse: bool = False,
+    ) -> List[MoodEntry]:
+        # Months are visited in the requested direction, so a limited
+        # query stops reading as soon as it has enough
+        shards, tail = self._state()
+        keys = self._months(shards, tail, start, end)
+        found: List[MoodEntry] = []
+        for key in reversed(keys) if reverse else keys:
+            if limit is not None and len(found) >= limit:
+                break
+            month = [
+                entry
+                for entry in self._iter_month(key, shards, tail)
+                if _in_range(entry, start, end)
+            ]
+            found.extend(reversed(month) if reverse else month)
+        return _limited(found, limit, False)
+
+
+class SqliteBackend(StorageBackend):
+    """A SQLite database with indexes on timestamp and score.
+
+    Meant for very large histories (think automated logging): range
+    lookups and aggregates run inside SQLite, so screens that only need
+    one month or a few numbers never build the full list of entries.
+    The database runs in WAL mode so readers don't block the writer.
+
+    Inserts run on the background writer through their own connection
+    (with ``synchronous=FULL``, so a committed entry survives a crash);
+    reads use a second connection and wait for queued inserts first.
+    """
+
+    indexed = True
+
+    _SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS moods (
+            id INTEGER PRIMARY KEY,
+            ts INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            tag TEXT,
+            note TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_moods_ts ON moods (ts)",
+        "CREATE INDEX IF NOT EXISTS idx_moods_score ON moods (score)",
+    )
+
+    def __init__(self, path: Path, writer: WriteBehindWriter = default_writer) -> None:
+        self.path = path
+        self.writer = writer
+        self._conn: Optional[sqlite3.Connection] = None
+        self._write_conn: Optional[sqlite3.Connection] = None
+
+    def _open(self, synchronous: str) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Each connection is only used under the repository lock or on
+        # the writer thread, so it's safe to share across threads
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        with conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._open("NORMAL")
+        return self._conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """The read connection, once any queued inserts have landed."""
+        self.writer.flush()
+        return self._connection()
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        if self._write_conn is None:
+            self._write_conn = self._open("FULL")
+        return self._write_conn
+
+    def close(self) -> None:
+        self.writer.flush()
+        for conn in (self._conn, self._write_conn):
+            if conn is not None:
+                conn.close()
+        self._conn = self._write_conn = None
+
+    def ensure(self) -> None:
+        self._connection()
+
+    def signature(self) -> int:
+        # data_version only changes when *another* connection commits,
+        # which is exactly the "changed behind our back" signal we need
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _row(entry: MoodEntry) -> Tuple[int, int, Optional[str], Optional[str]]:
+        return (entry.epoch, entry.score, entry.tag, entry.note)
+
+    @staticmethod
+    def _entry(row: Tuple[int, int, Optional[str], Optional[str]]) -> MoodEntry:
+        return MoodEntry.from_epoch(*row)
+
+    @staticmethod
+    def _where(start: Optional[datetime], end: Optional[datetime]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch_bound(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(_epoch_bound(end))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def load_all(self) -> List[MoodEntry]:
+        return self.query_range(None, None)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[MoodEntry]:
+        # Page through with a (ts, id) cursor instead of holding one
+        # statement open, so writes can interleave with a slow consumer
+        last = (-(2 ** 63), 0)
+        while True:
+            rows = self._reader().execute(
+                "SELECT ts, score, tag, note, id FROM moods"
+                " WHERE (ts, id) > (?, ?) ORDER BY ts, id LIMIT ?",
+                (*last, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._entry(row[:4])
+            last = (rows[-1][0], rows[-1][4])
+
+    def _insert(self, entries: List[MoodEntry], replace: bool = False) -> None:
+        conn = self._writer_connection()
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM moods")
+            conn.executemany(
+                "INSERT INTO moods (ts, score, tag, note) VALUES (?, ?, ?, ?)",
+                (self._row(entry) for entry in entries),
+            )
+
+    def append(self, entry: MoodEntry) -> Future:
+        return self.writer.call(lambda: self._insert([entry]))
+
+    def append_many(self, entries: List[MoodEntry]) -> None:
+        """Insert ``entries`` right away, bypassing the writer (used by migration)."""
+        self._insert(entries)
+
+    def replace_all(self, entries: List[MoodEntry]) -> Future:
+        entries = list(entries)
+        return self.writer.call(lambda: self._insert(entries, replace=True))
+
+    def query_range(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+        reverse: bool = False,
+    ) -> List[MoodEntry]:
+        where, params = self._where(start, end)
+        order = "ts DESC, id DESC" if reverse else "ts, id"
+        sql = f"SELECT ts, score, tag, note FROM moods{where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(limit, 0))
+        return [self._entry(row) for row in self._reader().execute(sql, params)]
+
+    def load_rollups(self) -> Rollups:
+        # Let SQLite group by (day, score); the floor division keeps days
+        # right for timestamps before 1970 too
+        rows = self._reader().execute(
+            "SELECT (ts - ((ts % 86400) + 86400) % 86400) / 86400 AS day, score, COUNT(*)"
+            " FROM moods GROUP BY day, score"
+        )
+        return Rollups.from_day_scores(
+            (day_of(day * 86400), score, times) for day, score, times in rows
+        )
+
+
+# With a cold cache, an indexed backend answers small queries itself (a
+# limited query, or a range no longer than a calendar month); anything
+# bigger loads the whole history once, and from then on every query is
+# a binary search over the cache
+DIRECT_QUERY_LIMIT = 500
+DIRECT_QUERY_SPAN = timedelta(days=31)
+
+
+def _is_small_query(
+    start: Optional[datetime], end: Optional[datetime], limit: Optional[int]
+) -> bool:
+    if limit is not None and limit <= DIRECT_QUERY_LIMIT:
+        return True
+    return start is not None and end is not None and end - start <= DIRECT_QUERY_SPAN
+
+
+def open_backend() -> StorageBackend:
+    """Pick the SQLite store if it has been set up, else the monthly shards."""
+    if DB_FILE.exists():
+        return SqliteBackend(DB_FILE)
+    return _default_shards()
+
+
+def _default_shards() -> ShardedBackend:
+    # Both earlier layouts (the JSON array in ``moods.json`` and the
+    # single ``moods.jsonl`` journal) are split into it on first run
+    return ShardedBackend(SHARD_DIR, legacy_sources=(JOURNAL_FILE, DATA_FILE))
+
+
+class MoodRepository:
+    """Process-wide, in-memory view of the mood store.
+
+    Every screen reads through the same repository, so the store is
+    parsed once and then served from memory. Before trusting the cache
+    we compare the backend's signature (for the journal: the file's
+    mtime, size and inode) with what we saw last time; if another
+    process (or a text editor) touched the data, we reload it. That
+    check is itself rate limited, so a burst of reads (say, a resize
+    storm) costs no disk I/O at all.
+
+    Writes update the cache immediately and reach the disk on the
+    background writer. While our own writes are in flight the cache is
+    the source of truth; once they land we adopt the new signature
+    instead of mistaking our own write for an outside change.
+
+    The cache is kept sorted by time, next to a compact array of the
+    entries' epoch seconds, so time-range queries are two binary
+    searches and a slice. Entries that arrive out of order (imports,
+    edited clocks) are inserted where they belong.
+
+    Alongside the entries it keeps day and month ``Rollups``, which can
+    be loaded on their own (the shard store saves them with each
+    snapshot) and are bumped in constant time for every new entry.
+    """
+
+    def __init__(self, backend: StorageBackend, revalidate_interval: float = 0.5) -> None:
+        self.backend = backend
+        self.revalidate_interval = revalidate_interval
+        self._entries: Optional[List[MoodEntry]] = None
+        self._epochs = array("q")
+        self._rollups: Optional[Rollups] = None
+        self._signature: Optional[Any] = None
+        self._checked_at = 0.0
+        self._storage_ready = False
+        self._lock = threading.RLock()
+        self._pending_writes = 0
+        self._resync = False
+        self._pending_lock = threading.Lock()
+
+    def _ensure_storage(self) -> None:
+        if not self._storage_ready:
+            self.backend.ensure()
+            self._storage_ready = True
+
+    def _validate(self) -> None:
+        """Drop whatever is cached if the store changed behind our back."""
+        if self._pending_writes:
+            return
+        now = time.monotonic()
+        if self._resync:
+            # Our own writes just landed; what's on disk now is the cache
+            self._resync = False
+            self._signature = self.backend.signature()
+            self._checked_at = now
+            return
+        if now - self._checked_at < self.revalidate_interval:
+            return
+        self._checked_at = now
+        if self.backend.signature() != self._signature:
+            self._drop_caches()
+
+    def _drop_caches(self) -> None:
+        self._entries = None
+        self._epochs = array("q")
+        self._rollups = None
+
+    def _is_fresh(self) -> bool:
+        """Whether the cached entries still match what's stored."""
+        self._validate()
+        return self._entries is not None
+
+    def _reload(self) -> None:
+        self._ensure_storage()
+        self.backend.flush()
+        self._validate()
+        signature = self.backend.signature()
+        if signature != self._signature:
+            # Rollups loaded earlier describe an older version of the store
+            self._rollups = None
+        entries = self.backend.load_all()
+        # Backends already return time order, which makes this a single
+        # pass; it keeps the index right for hand-edited files too
+        entries.sort(key=_entry_epoch)
+        self._set_entries(entries)
+        self._signature = signature
+        self._resync = False
+        self._checked_at = time.monotonic()
+
+    def _set_entries(self, entries: List[MoodEntry]) -> None:
+        self._entries = entries
+        self._epochs = array("q", (entry.epoch for entry in entries))
+
+    def _insert(self, entry: MoodEntry) -> None:
+        """Add ``entry`` to the cache, keeping it sorted by time."""
+        epochs = self._epochs
+        if not epochs or entry.epoch >= epochs[-1]:
+            self._entries.append(entry)
+            epochs.append(entry.epoch)
+            return
+        # Out of order: build new lists instead of shifting the old ones,
+        # so an iter_entries() walk that's in progress isn't disturbed
+        index = bisect.bisect_right(epochs, entry.epoch)
+        self._entries = self._entries[:index] + [entry] + self._entries[index:]
+        self._epochs = epochs[:index] + array("q", [entry.epoch]) + epochs[index:]
+
+    def _track(self, future: Future) -> Future:
+        """Count ``future`` as one of our in-flight writes."""
+        with self._pending_lock:
+            self._pending_writes += 1
+        future.add_done_callback(self._write_done)
+        return future
+
+    def _write_done(self, _: Future) -> None:
+        # Runs on the writer thread, so only flip flags here
+        with self._pending_lock:
+            self._pending_writes -= 1
+            if not self._pending_writes:
+                self._resync = True
+
+    def prepare(self) -> None:
+        """Create the backend's files (migrating older formats) if not done yet."""
+        with self._lock:
+            self._ensure_storage()
+
+    def flush(self) -> None:
+        """Block until every write made through the repository is durable."""
+        self.backend.flush()
+
+    def invalidate(self) -> None:
+        """Drop the cache so the next read goes back to disk."""
+        with self._lock:
+            self._drop_caches()
+            self._signature = None
+            self._storage_ready = False
+
+    def entries(self) -> List[MoodEntry]:
+        """Return all entries, reloading only when the store changed.
+
+        Callers get their own list, so sorting or filtering it can't
+        disturb the shared cache.
+        """
+        with self._lock:
+            if not self._is_fresh():
+                self._reload()
+            return list(self._entries)
+
+    def iter_entries(self) -> Iterator[MoodEntry]:
+        """Yield every entry, oldest first, using bounded extra memory.
+
+        When the cache is warm we walk it in place; otherwise entries are
+        streamed straight from the backend without filling the cache, so
+        a one-off pass over a huge history doesn't pin it in memory.
+        """
+        with self._lock:
+            self._ensure_storage()
+            fresh = self._is_fresh()
+            cached = self._entries
+        if fresh:
+            # Appends only ever extend the list, while out-of-order
+            # inserts and replace() swap in a new one, so walking the
+            # first ``count`` items is safe
+            count = len(cached)
+            for index in range(count):
+                yield cached[index]
+        else:
+            yield from self.backend.iter_all()
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        reverse: bool = False,
+    ) -> List[MoodEntry]:
+        """Entries with ``start <= timestamp < end``, oldest first.
+
+        Either bound may be omitted. With ``reverse`` the newest come
+        first, and ``limit`` keeps only the first that many, so
+        ``query(limit=12, reverse=True)`` is "the last twelve".
+        """
+        with self._lock:
+            self._ensure_storage()
+            if not self._is_fresh():
+                if self.backend.indexed and _is_small_query(start, end, limit):
+                    return self.backend.query_range(start, end, limit, reverse)
+                self._reload()
+            epochs = self._epochs
+            lo = 0 if start is None else bisect.bisect_left(epochs, _epoch_bound(start))
+            hi = len(epochs) if end is None else bisect.bisect_left(epochs, _epoch_bound(end))
+            if limit is not None:
+                limit = max(limit, 0)
+                if reverse:
+                    lo = max(lo, hi - limit)
+                else:
+                    hi = min(hi, lo + limit)
+            found = self._entries[lo:hi]
+            if reverse:
+                found.reverse()
+            return found
+
+    def rollups(self) -> Rollups:
+        """Day and month aggregates for the whole history.
+
+        Loaded once (from the snapshot when the store keeps one) and
+        then kept current as entries are appended. Don't modify it.
+        """
+        with self._lock:
+            self._ensure_storage()
+            self._validate()
+            if self._rollups is None:
+                if self._entries is not None:
+                    self._rollups = Rollups.from_entries(self._entries)
+                else:
+                    self.backend.flush()
+                    signature = self.backend.signature()
+                    self._rollups = self.backend.load_rollups()
+                    self._signature = signature
+                    self._checked_at = time.monotonic()
+            return self._rollups
+
+    def append(self, entry: MoodEntry) -> Future:
+        """Append one entry to the cache now and to the store in the background.
+
+        Returns a future that resolves once the entry is durable.
+        """
+        with self._lock:
+            self._ensure_storage()
+            was_fresh = self._is_fresh()
+            future = self._track(self.backend.append(entry))
+            if was_fresh:
+                self._insert(entry)
+            else:
+                self._entries = None
+            if self._rollups is not None:
+                self._rollups.add(entry)
+            return future
+
+    def replace(self, entries: List[MoodEntry]) -> Future:
+        """Rewrite the store with ``entries`` and cache them."""
+        with self._lock:
+            self._ensure_storage()
+            future = self._track(self.backend.replace_all(entries))
+            self._set_entries(sorted(entries, key=_entry_epoch))
+            self._rollups = Rollups.from_entries(self._entries)
+            return future
+
+
+# Shared by every screen in the app
+repository = MoodRepository(open_backend())
+
+
+def init_storage() -> None:
+    """Prepare the store the app uses, migrating older formats on first run.
+
+    Only the active backend is touched, so nothing is created next to a
+    SQLite database. The first run can take a while; code on the event
+    loop should use ``init_storage_async``.
+    """
+    repository.prepare()
+
+
+async def init_storage_async() -> None:
+    """``init_storage`` on a worker thread."""
+    await asyncio.to_thread(init_storage)
+
+
+def load_rollups() -> Rollups:
+    """Per-day and per-month count, sum, min, max and score histogram.
+
+    Reads precomputed numbers instead of scanning the history, so it's
+    the cheap way to get totals, averages and "most frequent" for any
+    day, month or the whole store.
+    """
+    return repository.rollups()
+
+
+def load_moods() -> List[MoodEntry]:
+    """Load moods with gentle validation to handle corrupted data."""
+    return repository.entries()
+
+
+def iter_moods() -> Iterator[MoodEntry]:
+    """Yield mood entries one at a time, oldest first, in bounded memory.
+
+    Use this instead of ``load_moods`` for single passes over the whole
+    history (exports, statistics) so that no full copy is built.
+    """
+    return repository.iter_entries()
+
+
+def query_moods(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    reverse: bool = False,
+) -> List[MoodEntry]:
+    """Entries with ``start <= timestamp < end``, oldest first.
+
+    Pass ``reverse=True`` for newest first and ``limit`` to cap the
+    result, e.g. ``query_moods(limit=12, reverse=True)`` for the twelve
+    most recent. Served from the sorted in-memory index when it's warm;
+    otherwise small queries (a limit, or a month) are answered by the
+    store without loading the whole history, and bigger ones warm it.
+    """
+    return repository.query(start, end, limit, reverse)
+
+
+async def load_moods_async() -> List[MoodEntry]:
+    """``load_moods`` on a worker thread, for code running on the event loop.
+
+    Cancelling the awaiting task (say, an exclusive Textual worker that
+    was replaced) abandons the result right away; the read itself
+    finishes in the background and just leaves the cache warm.
+    """
+    return await asyncio.to_thread(load_moods)
+
+
+async def query_moods_async(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    reverse: bool = False,
+) -> List[MoodEntry]:
+    """``query_moods`` on a worker thread; see ``load_moods_async``."""
+    return await asyncio.to_thread(query_moods, start, end, limit, reverse)
+
+
+def append_mood(entry: MoodEntry) -> Future:
+    """Append a single entry to the journal without touching older entries.
+
+    This is the cheap path for logging a new mood: the cost is one line
+    of I/O no matter how long the history is, and it happens on the
+    background writer. The returned future resolves once it's durable.
+    """
+    return repository.append(entry)
+
+
+async def append_mood_async(entry: MoodEntry) -> None:
+    """``append_mood`` for code on the event loop; returns once the entry is durable.
+
+    The repository's lock is taken on a worker thread, so saving never
+    stalls the UI behind a reload that holds it. The wait is on a thread
+    too, so cancelling the caller stops it waiting but never cancels
+    the write.
+    """
+    saved = await asyncio.to_thread(append_mood, entry)
+    await asyncio.to_thread(saved.result)
+
+
+def save_moods(entries: List[MoodEntry]) -> Future:
+    """Replace the whole store with the given entries, sorted by time.
+
+    Prefer ``append_mood`` for adding a single entry; this rewrites
+    every line and is kept for callers that edit history in bulk.
+    """
+    return repository.replace(entries)
+
+
+def migrate_to_sqlite() -> int:
+    """Copy every entry from the JSON shard store into a new SQLite database.
+
+    The database is built under a temporary name and renamed into place
+    once complete, so an interrupted run leaves the shards in charge.
+    The shard folder is then kept as ``moods.migrated`` and the app uses
+    the database from its next launch. Returns the number of entries
+    copied.
+    """
+    if DB_FILE.exists():
+        raise FileExistsError(f"{DB_FILE} already exists")
+    # Check where the shards go before building anything, so a clash
+    # can't leave the database and the shards both in place
+    migrated = SHARD_DIR.with_name(SHARD_DIR.name + ".migrated")
+    if migrated.exists():
+        raise FileExistsError(f"{migrated} already exists; move it out of the way first")
+    shards = _default_shards()
+    shards.ensure()
+    entries = shards.load_all()
+
+    tmp_file = DB_FILE.with_suffix(".db.tmp")
+    tmp_file.unlink(missing_ok=True)
+    backend = SqliteBackend(tmp_file)
+    backend.append_many(entries)
+    backend.close()
+    tmp_file.replace(DB_FILE)
+    SHARD_DIR.replace(migrated)
+    return len(entries)
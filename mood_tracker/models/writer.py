@@ -0,0 +1,236 @@
+"""Durable file writes, done in the background.
+
+Everything the app persists goes through a single ``WriteBehindWriter``
+thread so that the Textual event loop never waits on the disk. Whole
+files are replaced atomically (temp file, fsync, rename), appends are
+fsynced, and writes that queue up while the thread is busy are
+committed together: a run of consecutive writes to one file becomes one
+write and one fsync (only its newest replacement plus the appends after
+it), while everything keeps the order it was submitted in.
+
+Each submitted write returns a ``concurrent.futures.Future`` that
+resolves once the data is on disk. UI code that needs to know (for
+example before showing "saved!") can
+``await asyncio.shield(asyncio.wrap_future(fut))``; without the shield a
+cancelled task would cancel the write too. Cancelling a future only
+drops its write if the thread hasn't picked it up yet.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+_APPEND = "append"
+_REPLACE = "replace"
+_CALL = "call"
+
+# How long the exit hook waits for queued writes (seconds)
+EXIT_FLUSH_TIMEOUT = 10.0
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Make a rename inside ``directory`` durable (best effort off POSIX)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path: Path, text: Optional[Union[str, bytes]]) -> None:
+    """Replace ``path`` with ``text`` so readers see the old or new file, never half.
+
+    The text goes to a temp file in the same folder, is fsynced and then
+    renamed over the original. ``bytes`` are written as they are, and
+    passing ``None`` deletes the file.
+    """
+    if text is None:
+        path.unlink(missing_ok=True)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(path.name + ".tmp")
+        if isinstance(text, bytes):
+            f = tmp_file.open("wb")
+        else:
+            f = tmp_file.open("w", encoding="utf-8")
+        with f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    _fsync_directory(path.parent)
+
+
+def durable_append(path: Path, data: bytes) -> None:
+    """Append ``data`` to ``path`` and fsync it.
+
+    If a previous write was cut short and left a partial line, we start
+    on a fresh line so the broken fragment doesn't swallow this one too.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class _Group:
+    """Everything one batch does to a single file (or one queued call)."""
+
+    __slots__ = ("path", "replace", "has_replace", "appends", "call", "futures")
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.replace: Optional[Union[str, bytes]] = None
+        self.has_replace = False
+        self.appends: List[bytes] = []
+        self.call: Optional[Callable[[], None]] = None
+        self.futures: List[Future] = []
+
+    def run(self) -> None:
+        if self.call is not None:
+            self.call()
+            return
+        if self.has_replace:
+            atomic_write_text(self.path, self.replace)
+        if self.appends:
+            durable_append(self.path, b"".join(self.appends))
+
+
+class WriteBehindWriter:
+    """A background thread that commits queued writes in groups."""
+
+    def __init__(self, name: str = "mood-tracker-writer") -> None:
+        self.name = name
+        self._ops: List[Tuple[int, str, Optional[Path], object, Future]] = []
+        self._seq = itertools.count(1)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _submit(self, kind: str, path: Optional[Path], payload: object) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._ops.append((next(self._seq), kind, path, payload, future))
+            self._in_flight += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def append(self, path: Path, data: bytes) -> Future:
+        """Queue ``data`` to be appended to ``path``."""
+        return self._submit(_APPEND, path, data)
+
+    def replace(self, path: Path, text: Optional[Union[str, bytes]]) -> Future:
+        """Queue an atomic replacement of ``path`` (``None`` deletes it)."""
+        return self._submit(_REPLACE, path, text)
+
+    def call(self, fn: Callable[[], None]) -> Future:
+        """Queue ``fn`` to run on the writer thread, in order with other writes."""
+        return self._submit(_CALL, None, fn)
+
+    @property
+    def pending(self) -> int:
+        """How many submitted writes are not yet on disk."""
+        return self._in_flight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything submitted so far is durable."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ops)
+                batch, self._ops = self._ops, []
+            try:
+                self._commit(batch)
+            finally:
+                # Even if the batch blew up, flush() must not wait on it forever
+                with self._cond:
+                    self._in_flight -= len(batch)
+                    self._cond.notify_all()
+
+    def _commit(self, batch: List[Tuple[int, str, Optional[Path], object, Future]]) -> None:
+        groups: List[_Group] = []
+        for _, kind, path, payload, future in batch:
+            if not future.set_running_or_notify_cancel():
+                # Cancelled while queued: like an executor, don't do it at all
+                continue
+            # A write joins the group before it only if that is a write to
+            # the same file; calls, and writes to other files in between,
+            # start a new group, so e.g. an append queued after a compaction
+            # call is never folded into one queued before it
+            group = groups[-1] if groups else None
+            if kind == _CALL or group is None or group.call is not None or group.path != path:
+                group = _Group(path)
+                groups.append(group)
+            if kind == _CALL:
+                group.call = payload
+            elif kind == _REPLACE:
+                # A replacement supersedes anything queued for the file before it
+                group.has_replace = True
+                group.replace = payload
+                group.appends = []
+            else:
+                group.appends.append(payload)
+            group.futures.append(future)
+
+        for group in groups:
+            try:
+                group.run()
+            except Exception as exc:  # report to whoever is waiting
+                for future in group.futures:
+                    future.set_exception(exc)
+            else:
+                for future in group.futures:
+                    future.set_result(None)
+
+
+def gather(futures: List[Future]) -> Future:
+    """A future that resolves once all ``futures`` have, failing if any did."""
+    combined: Future = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            combined.set_exception(errors[0])
+        else:
+            combined.set_result(None)
+
+    if not futures:
+        combined.set_result(None)
+    for future in futures:
+        future.add_done_callback(_done)
+    return combined
+
+
+# Shared by everything that persists data
+writer = WriteBehindWriter()
+
+# Don't lose queued writes when the app exits, but don't hang it on a stuck disk
+atexit.register(writer.flush, EXIT_FLUSH_TIMEOUT)
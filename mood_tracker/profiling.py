@@ -0,0 +1,160 @@
+"""Startup profiling, for ``run.py --profile-startup``.
+
+Starts the app as usual and times the way to a usable screen: importing
+the app, mounting the main screen, its first frame, and the first frame
+showing the mood history. The app closes itself once the history is up
+and a report is printed, followed by a per-package breakdown of import
+time taken from ``python -X importtime`` in a child process.
+
+Run it in the terminal you actually use (over SSH, say) to see what the
+startup really costs there; ``--startup-budget`` turns it into a check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# How many packages to list in the import breakdown
+TOP_PACKAGES = 8
+# How long to wait for the audio mixer before leaving it out of the report
+AUDIO_TIMEOUT = 5
+# Where the child interpreter runs, so it imports this checkout wherever
+# run.py was started from
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class StartupProfile:
+    """Named moments since profiling started, in milliseconds."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, label: str) -> None:
+        """Record ``label`` as happening now (safe to call from any thread)."""
+        self.marks.append((label, (time.perf_counter() - self.start) * 1000))
+
+    def elapsed(self, label: str) -> Optional[float]:
+        for name, ms in self.marks:
+            if name == label:
+                return ms
+        return None
+
+
+async def _after_refresh(app) -> None:
+    """Wait until the screen has been painted again."""
+    painted = asyncio.Event()
+    app.screen.call_after_refresh(painted.set)
+    await painted.wait()
+
+
+def _watch_startup(profile: StartupProfile):
+    """An auto pilot that records the startup milestones, then quits."""
+
+    async def auto_pilot(pilot) -> None:
+        from .views.main import MainScreen
+
+        app = pilot.app
+        while not isinstance(app.screen, MainScreen):
+            await asyncio.sleep(0.001)
+        profile.mark("main screen mounted")
+        screen = app.screen
+
+        # Audio loads on its own thread; note when it's done, as it happens
+        def watch_audio() -> None:
+            if screen.sound_manager.ready.wait(AUDIO_TIMEOUT):
+                profile.mark("audio ready (background)")
+
+        audio = threading.Thread(target=watch_audio, daemon=True)
+        audio.start()
+
+        await _after_refresh(app)
+        profile.mark("first frame")
+        while screen._history_view is None:
+            await asyncio.sleep(0.001)
+        await _after_refresh(app)
+        profile.mark("history shown")
+        await asyncio.to_thread(audio.join)
+        app.exit()
+
+    return auto_pilot
+
+
+def import_breakdown(module: str = "mood_tracker.app") -> Dict[str, float]:
+    """Milliseconds spent importing each top-level package on the way to ``module``.
+
+    Uses a fresh interpreter so nothing is imported already; times are
+    each module's own import time, summed per package. Raises
+    ``RuntimeError`` with the child's last error line if the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        errors = [
+            line for line in result.stderr.splitlines() if not line.startswith("import time:")
+        ]
+        raise RuntimeError(errors[-1] if errors else f"exit status {result.returncode}")
+    packages: Dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].strip().split(".")[0]
+        packages[name] += int(fields[0]) / 1000
+    return dict(packages)
+
+
+def profile_startup(budget_ms: Optional[float] = None) -> int:
+    """Run the app once, print the startup report and return an exit status.
+
+    The status is 1 when ``budget_ms`` is given and the first frame took
+    longer than that, else 0.
+    """
+    profile = StartupProfile()
+    from .app import MoodTrackerApp
+
+    profile.mark("app imported")
+    app = MoodTrackerApp()
+    app.run(auto_pilot=_watch_startup(profile))
+
+    print("Startup profile (ms since profiling started)")
+    previous = 0.0
+    for label, ms in sorted(profile.marks, key=lambda mark: mark[1]):
+        print(f"  {label:<28} {ms:8.1f}   (+{ms - previous:.1f})")
+        previous = ms
+
+    print()
+    print("Import time by package (fresh interpreter)")
+    try:
+        packages = import_breakdown()
+    except RuntimeError as exc:
+        print(f"  ✗ Couldn't import the app in a fresh interpreter: {exc}")
+    else:
+        ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for name, ms in ranked[:TOP_PACKAGES]:
+            print(f"  {name:<28} {ms:8.1f}")
+        rest = sum(ms for _, ms in ranked[TOP_PACKAGES:])
+        print(f"  {'everything else':<28} {rest:8.1f}")
+
+    first_frame = profile.elapsed("first frame")
+    if budget_ms is not None:
+        print()
+        if first_frame is None or first_frame > budget_ms:
+            print(f"✗ First frame missed the {budget_ms:.0f} ms budget")
+            return 1
+        print(f"✓ First frame within the {budget_ms:.0f} ms budget")
+    return 0
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import calendar
 from datetime import date, datetime
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static
 from textual.containers import Vertical
 from textual import events
+from textual.timer import Timer
 
-from ..models.storage import load_moods, MoodEntry
+from ..constants import RESIZE_DEBOUNCE
+from ..models.rollups import Rollup
+from ..models.storage import query_moods, load_rollups, MoodEntry
 
 
 class MonthlyCalendarScreen(Screen):
@@ -51,8 +56,14 @@ class MonthlyCalendarScreen(Screen):
         self.border_style = border_style
         # Start with today's date, but we'll let users navigate away from it
         self.current_month = date.today().replace(day=1)
-        # We'll cache mood data to avoid reloading from disk on every render
+        # We'll cache the displayed month's data to avoid reloading it on every render
         self.moods_by_date: Dict[date, MoodEntry] = {}
+        # None while the month is still being loaded
+        self.month_summary: Optional[Rollup] = None
+        # Rendered calendar markup by width, for the data currently shown
+        self._rendered: Dict[int, str] = {}
+        self._shown: Optional[str] = None
+        self._resize_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Build the calendar display container.
@@ -69,23 +80,64 @@ class MonthlyCalendarScreen(Screen):
             )
 
     def on_mount(self) -> None:
-        """Load mood data and render the initial calendar when the screen appears."""
-        self._load_mood_data()
+        """Render the empty grid right away, then fill it in once data arrives."""
         self._render_calendar()
+        self._load_mood_data()
 
     def on_resize(self, event) -> None:
-        """Handle terminal resize to update calendar display."""
-        self._render_calendar()
+        """Handle terminal resize to update calendar display.
 
-    def _load_mood_data(self) -> None:
-        """Load all mood entries and organize them by date for quick lookup.
+        Resize events come in bursts while a terminal edge is dragged, so
+        we wait for the last one (at most one redraw per frame). The
+        width is clamped and its renders are cached, so most redraws
+        don't build anything.
+        """
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(RESIZE_DEBOUNCE, self._apply_resize)
 
-        By creating a dictionary mapping dates to mood entries, we can
-        quickly check if a given calendar day has a mood entry without
-        having to search through the entire list every time.
+    def _apply_resize(self) -> None:
+        self._resize_timer = None
+        self._render_calendar()
+
+    @work(exclusive=True)
+    async def _load_mood_data(self) -> None:
+        """Load the displayed month's entries and organize them by date.
+
+        Only the current month is fetched from the store, so the cost of
+        opening the calendar doesn't grow with the length of the history.
+        The fetch runs on a worker thread; flipping quickly through
+        months cancels the loads that are no longer needed. By creating
+        a dictionary mapping dates to mood entries, we can quickly check
+        if a given calendar day has a mood entry without having to
+        search through the list every time.
         """
-        entries = load_moods()
+        entries, summary = await asyncio.to_thread(self._fetch_month, self.current_month)
         self.moods_by_date = {entry.timestamp.date(): entry for entry in entries}
+        self.month_summary = summary
+        self._rendered.clear()
+        self._render_calendar()
+
+    def _fetch_month(self, month: date) -> Tuple[List[MoodEntry], Rollup]:
+        """Read one month's entries and rollup (blocking; run in a thread)."""
+        month_start = datetime.combine(month, datetime.min.time())
+        month_end = datetime.combine(self._month_after(month), datetime.min.time())
+        summary = load_rollups().month(month.year, month.month)
+        return query_moods(month_start, month_end), summary
+
+    def _show_loading(self) -> None:
+        """Clear the previous month's data and draw the grid while it loads."""
+        self.moods_by_date = {}
+        self.month_summary = None
+        self._rendered.clear()
+        self._render_calendar()
+
+    @staticmethod
+    def _month_after(month: date) -> date:
+        """First day of the month after ``month``."""
+        if month.month == 12:
+            return date(month.year + 1, 1, 1)
+        return date(month.year, month.month + 1, 1)
 
     def action_previous_month(self) -> None:
         """Navigate to the previous month and re-render the calendar.
@@ -104,7 +156,8 @@ class MonthlyCalendarScreen(Screen):
         else:
             self.current_month = date(year, month - 1, 1)
 
-        self._render_calendar()
+        self._show_loading()
+        self._load_mood_data()
 
     def action_next_month(self) -> None:
         """Navigate to the next month and re-render the calendar.
@@ -122,31 +175,45 @@ class MonthlyCalendarScreen(Screen):
         else:
             self.current_month = date(year, month + 1, 1)
 
-        self._render_calendar()
+        self._show_loading()
+        self._load_mood_data()
 
     def action_dismiss(self) -> None:
         """Close the calendar and return to the main screen."""
         self.app.pop_screen()
 
+    def _calendar_width(self) -> int:
+        """Width of the calendar for the current terminal size."""
+        terminal_width = self.size.width
+        # Calendar should be 60% of screen width, with min/max bounds
+        return max(40, min(int(terminal_width * 0.6), 60))
+
     def _render_calendar(self) -> None:
-        """Build and display the complete calendar grid for the current month.
+        """Show the calendar at the current width, building it if needed.
+
+        Renders are kept per width until the displayed data changes, and
+        the widget is only updated when the markup actually differs.
+        """
+        calendar_width = self._calendar_width()
+        markup = self._rendered.get(calendar_width)
+        if markup is None:
+            markup = self._rendered[calendar_width] = self._build_calendar(calendar_width)
+        if markup != self._shown:
+            self._shown = markup
+            self.query_one("#calendar-display", Static).update(markup)
+
+    def _build_calendar(self, calendar_width: int) -> str:
+        """Build the complete calendar grid for the current month.
 
         This is where all the calendar magic happens. We use Python's calendar
         module to get the structure of the month, then we iterate through each
         week and day to build the visual representation. Days with mood entries
         get special formatting to make them stand out.
         """
-        calendar_display = self.query_one("#calendar-display", Static)
-
         year = self.current_month.year
         month = self.current_month.month
         month_name = calendar.month_name[month]
 
-        # Calculate responsive width based on terminal size
-        terminal_width = self.size.width
-        # Calendar should be 60% of screen width, with min/max bounds
-        calendar_width = max(40, min(int(terminal_width * 0.6), 60))
-
         # Get the calendar structure for this month as a list of weeks
         # Each week is a list of day numbers, with 0 for days outside the month
         cal = calendar.monthcalendar(year, month)
@@ -192,16 +259,14 @@ class MonthlyCalendarScreen(Screen):
         lines.append("")
         lines.append(self._colorize("─" * separator_width, self.palette.text_muted))
 
-        # Calculate and show monthly statistics
-        month_entries = [
-            entry
-            for day_date, entry in self.moods_by_date.items()
-            if day_date.year == year and day_date.month == month
-        ]
-
-        if month_entries:
-            avg_mood = sum(e.score for e in month_entries) / len(month_entries)
-            stats = f"Entries: {len(month_entries)}  •  Average: {avg_mood:.1f}/10"
+        # Show monthly statistics from the store's precomputed rollups
+        summary = self.month_summary
+        if summary is None:
+            lines.append(
+                self._colorize("Loading…".center(calendar_width), self.palette.text_muted)
+            )
+        elif summary.count:
+            stats = f"Entries: {summary.count}  •  Average: {summary.average:.1f}/10"
             lines.append(
                 self._colorize(stats.center(calendar_width), self.palette.accent_low)
             )
@@ -213,8 +278,8 @@ class MonthlyCalendarScreen(Screen):
                 )
             )
 
-        # Update the display widget with our beautifully formatted calendar
-        calendar_display.update("\n".join(lines))
+        # Our beautifully formatted calendar, ready for the display widget
+        return "\n".join(lines)
 
     def _format_day_cell(self, day: int, day_date: date, today: date) -> str:
         """Format a single day cell in the calendar grid.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 
@@ -8,7 +9,7 @@ from textual.screen import Screen
 from textual.widgets import Static, Button
 from textual.containers import Vertical, Horizontal
 
-from ..models.storage import load_moods
+from ..models.storage import iter_moods, load_rollups
 from ..models.export import export_to_csv, export_to_json, export_to_markdown
 
 
@@ -65,9 +66,9 @@ class ExportScreen(Screen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle export format selection and file writing.
         
-        When a user clicks an export button, we load all mood data,
-        write it to a file in their Downloads folder, and show them
-        a success message with the file location.
+        When a user clicks an export button, we stream the mood data
+        into a file in their Downloads folder, and show them a success
+        message with the file location.
         """
         button_id = event.button.id
         
@@ -76,13 +77,15 @@ class ExportScreen(Screen):
             self.dismiss()
             return
         
-        # Load all mood entries from storage
-        entries = load_moods()
+        # Stream entries from storage rather than loading them all at once
+        entries = iter_moods()
+        first_entry = next(entries, None)
         
-        if not entries:
+        if first_entry is None:
             # Show an error if there's no data to export
             self._show_status("No mood entries to export!", is_error=True)
             return
+        entries = chain([first_entry], entries)
         
         # Create a timestamped filename to avoid overwrites
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -101,7 +104,8 @@ class ExportScreen(Screen):
                 
             elif button_id == "export-md":
                 output_file = downloads_path / f"mood_tracker_{timestamp}.md"
-                export_to_markdown(entries, output_file)
+                # Summary numbers come precomputed from the store's rollups
+                export_to_markdown(entries, output_file, load_rollups())
                 self._show_status(f"✓ Exported to {output_file}")
             
             # Automatically close the modal after a successful export
@@ -1,8 +1,11 @@
+import asyncio
+
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import DataTable, Static, Header, Footer
 from textual.containers import Vertical, Horizontal
-from ..models.storage import load_moods
+from ..models.storage import query_moods_async, load_rollups
 from ..constants import MOOD_OPTIONS
 
 class HistoryScreen(Screen):
@@ -22,16 +25,21 @@ class HistoryScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self._load_data()
-
-    def _load_data(self) -> None:
-        entries = load_moods()
         table = self.query_one(DataTable)
         table.add_columns("Date", "Time", "Mood", "Score", "Note")
-        
-        # Sort entries by timestamp descending
-        entries.sort(key=lambda x: x.timestamp, reverse=True)
+        # Placeholder until the entries arrive from the worker thread
+        table.add_row("Loading…", "", "", "", "")
+        self.query_one("#stats-panel").update("Loading…")
+        self._load_data()
+
+    @work(exclusive=True)
+    async def _load_data(self) -> None:
+        # Newest first, straight from the store's sorted index
+        entries = await query_moods_async(reverse=True)
+        stats_text = await asyncio.to_thread(self._stats_text)
 
+        table = self.query_one(DataTable)
+        table.clear()
         for entry in entries:
             date_str = entry.timestamp.strftime("%Y-%m-%d")
             time_str = entry.timestamp.strftime("%H:%M")
@@ -45,21 +53,20 @@ class HistoryScreen(Screen):
             
             table.add_row(date_str, time_str, label, str(entry.score), note)
 
-        self._update_stats(entries)
+        self.query_one("#stats-panel").update(stats_text)
+
+    def _stats_text(self) -> str:
+        # Precomputed by the store's rollups, so this costs the same
+        # however long the history gets (blocking; run in a thread)
+        overall = load_rollups().overall
+        total = overall.count
 
-    def _update_stats(self, entries) -> None:
-        if not entries:
+        if not total:
             stats_text = "No entries yet."
         else:
-            total = len(entries)
-            avg_score = sum(e.score for e in entries) / total
-            
-            # Count moods
-            mood_counts = {}
-            for e in entries:
-                mood_counts[e.score] = mood_counts.get(e.score, 0) + 1
+            avg_score = overall.average
             
-            top_mood_score = max(mood_counts, key=mood_counts.get)
+            top_mood_score = overall.mode
             top_mood_label = next((label for label, score in MOOD_OPTIONS if score == top_mood_score), str(top_mood_score))
 
             stats_text = (
@@ -67,5 +74,5 @@ class HistoryScreen(Screen):
                 f"Average Mood: {avg_score:.1f}/10 | "
                 f"Most Frequent: {top_mood_label}"
             )
-        
-        self.query_one("#stats-panel").update(stats_text)
+
+        return stats_text
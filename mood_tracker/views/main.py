@@ -1,21 +1,33 @@
 from __future__ import annotations
-from .reflection import ReflectionPromptScreen
-from .export import ExportScreen
-from .history import HistoryScreen
-from .theme_mascot_popup import ThemeMascotPopup
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from typing import Callable, Hashable, Sequence
+from rich.segment import Segment
+from rich.style import Style
 from textual.app import ComposeResult
+from textual.cache import LRUCache
+from textual.geometry import Region, Size
+from textual.timer import Timer
 from textual.screen import Screen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widget import Widget
 from textual.widgets import Static
 from textual.containers import Container, Vertical
 from textual import events
-from ..models.storage import load_moods, save_moods, MoodEntry
-from ..theme import DEFAULT_THEME_NAME, THEMES, get_palette, get_border_style
+from ..models.rollups import Rollups
+from ..models.storage import (
+    query_moods_async,
+    append_mood_async,
+    load_rollups,
+    MoodEntry,
+)
+from ..theme import DEFAULT_THEME_NAME, ThemeStyles, compile_theme, theme_names
 from ..models.preferences import load_preferences, save_preferences
-from .calendar import MonthlyCalendarScreen
 from ..audio import SoundManager
 from ..widgets.mood_companion import MoodCompanion
-from ..constants import MOOD_OPTIONS
+from ..constants import MOOD_OPTIONS, RESIZE_DEBOUNCE
 from textual import work
 import asyncio
 
@@ -24,9 +36,43 @@ MIN_BOX_WIDTH = 80  # Minimum box width for small screens
 MAX_BOX_WIDTH = 140  # Maximum box width for large screens
 DEFAULT_BOX_WIDTH = 125  # Default/preferred box width
 
-# These will be dynamically calculated based on screen size
-BOX_WIDTH = DEFAULT_BOX_WIDTH
-INNER_WIDTH = BOX_WIDTH - 2
+
+
+@dataclass(frozen=True)
+class LayoutContext:
+    """The box geometry a screen draws at, handed to each widget that draws it.
+
+    Widgets used to read module globals that the main screen rewrote on
+    every resize. A context is an immutable value instead: a render
+    depends only on the context and what is drawn, so it can be cached
+    on both, and two screens of different sizes can render side by side.
+    """
+    box_width: int = DEFAULT_BOX_WIDTH
+
+    @property
+    def inner_width(self) -> int:
+        """Width between the left and right borders."""
+        return self.box_width - 2
+
+    @classmethod
+    def for_terminal(cls, terminal_width: int) -> LayoutContext:
+        """The box layout for a terminal ``terminal_width`` columns wide."""
+        # Leave some margin on each side (10% on each side minimum)
+        available_width = int(terminal_width * 0.8)
+
+        # Constrain to min/max bounds
+        return cls(max(MIN_BOX_WIDTH, min(available_width, MAX_BOX_WIDTH)))
+
+
+DEFAULT_LAYOUT = LayoutContext()
+
+# How many recent moods the history list shows outside the extended view
+HISTORY_PREVIEW_LENGTH = 12
+
+# Lines of the main box that change after it is built
+SELECTOR_LINE = 7  # in the header section
+DIVIDER_LINE = 10  # in the header section
+FOOTER_LINE = 0  # in the footer section
 
 
 def bar_color_for_score(score: int) -> str:
@@ -43,6 +89,211 @@ def bar_color_for_score(score: int) -> str:
         return "bright_red"
 
 
+def label_for_score(score: int) -> str:
+    """Get mood label for score."""
+    if score >= 9:
+        return "Great"
+    if score >= 7:
+        return "Good"
+    if score >= 5:
+        return "Meh"
+    if score >= 3:
+        return "Bad"
+    return "Awful"
+
+
+def fixed_bar_length_for_score(score: int) -> int:
+    """Get fixed bar length based on mood intensity (not relative)."""
+    # Great = 8 blocks, Awful = 2 blocks
+    if score >= 9:
+        return 8
+    if score >= 7:
+        return 6
+    if score >= 5:
+        return 4
+    if score >= 3:
+        return 3
+    return 2
+
+
+def format_time_gap(seconds: float) -> str:
+    """Format time gap in human-readable format."""
+    if seconds < 60:
+        return "< 1m"
+    elif seconds < 3600:
+        minutes = int(seconds / 60)
+        return f"{minutes}m"
+    elif seconds < 86400:
+        hours = int(seconds / 3600)
+        minutes = int((seconds % 3600) / 60)
+        if minutes > 0:
+            return f"{hours}h {minutes}m"
+        return f"{hours}h"
+    else:
+        days = int(seconds / 86400)
+        hours = int((seconds % 86400) / 3600)
+        if hours > 0:
+            return f"{days}d {hours}h"
+        return f"{days}d"
+
+
+@dataclass(frozen=True)
+class TimelineRow:
+    """Everything the history list shows for one entry."""
+    time_str: str
+    label: str
+    bar_length: int
+    color: str
+    gap: str | None  # time since the previous entry, if there is one
+
+
+@dataclass
+class TimelineDay:
+    """One date card in the history list."""
+    day: date
+    date_str: str
+    rows: list[TimelineRow] = field(default_factory=list)
+
+
+def build_timeline(
+    entries: Sequence[MoodEntry], previous: MoodEntry | None = None
+) -> list[TimelineDay]:
+    """Turn entries (oldest first) into date cards of display rows in one pass.
+
+    Each row's gap is measured from the entry before it, which for the
+    first row of a card is the last row of the card above, so no lookups
+    are needed. ``previous`` is the entry just before ``entries`` when
+    extending a timeline that was already built.
+    """
+    # Label, bar and colour only depend on the score and the clock text
+    # only on the minute of the day, so each is formatted once
+    by_score: dict[int, tuple[str, int, str]] = {}
+    by_minute: dict[int, str] = {}
+    days: list[TimelineDay] = []
+    current = None
+    current_day = None
+    for entry in entries:
+        epoch = entry.epoch
+        # Timestamps are naive epoch seconds, so whole days divide evenly
+        day_number, second = divmod(epoch, 86400)
+        if day_number != current_day:
+            timestamp = entry.timestamp
+            current = TimelineDay(timestamp.date(), timestamp.strftime("%b %d"))  # "Nov 22"
+            current_day = day_number
+            days.append(current)
+
+        looks = by_score.get(entry.score)
+        if looks is None:
+            looks = by_score[entry.score] = (
+                label_for_score(entry.score),
+                fixed_bar_length_for_score(entry.score),
+                bar_color_for_score(entry.score),
+            )
+        minute = second // 60
+        time_str = by_minute.get(minute)
+        if time_str is None:
+            time_str = by_minute[minute] = entry.timestamp.strftime("%I:%M %p")  # "08:00 AM"
+        gap = format_time_gap(epoch - previous.epoch) if previous is not None else None
+        current.rows.append(TimelineRow(time_str, *looks, gap))
+        previous = entry
+    return days
+
+
+def _same_row(a: MoodEntry, b: MoodEntry) -> bool:
+    """Whether two entries show as the same timeline row (time and score)."""
+    return a.epoch == b.epoch and a.score == b.score
+
+
+class TimelineCache:
+    """Keeps the last built timeline so refreshes only redo what changed.
+
+    A row only depends on its entry's time and score (and the entry
+    before it), so entries are compared by those rather than by
+    identity: reloads from the store hand back new but equal objects.
+    If the new list matches the old one we reuse the timeline as is,
+    and if it only grew at the end we build just the new rows and
+    stitch them on.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[MoodEntry] = []
+        self._days: list[TimelineDay] = []
+
+    def build(self, entries: Sequence[MoodEntry]) -> list[TimelineDay]:
+        """The cards for ``entries``, remembered for the next call."""
+        days = self.compute(entries)
+        self.store(entries, days)
+        return days
+
+    def compute(self, entries: Sequence[MoodEntry]) -> list[TimelineDay]:
+        """The cards for ``entries``, without remembering them.
+
+        Safe to run on a worker thread: nothing here is changed, so a
+        refresh that gets cancelled halfway leaves the cache as it was.
+        Call ``store`` with the result once it's actually shown.
+        """
+        old = self._entries
+        if len(old) <= len(entries) and all(map(_same_row, old, entries)):
+            if len(old) == len(entries):
+                return self._days
+            tail = build_timeline(entries[len(old):], old[-1] if old else None)
+            days = list(self._days)
+            if days and tail and days[-1].day == tail[0].day:
+                # The new rows continue the last card
+                last = days.pop()
+                first = tail.pop(0)
+                days.append(TimelineDay(last.day, last.date_str, last.rows + first.rows))
+            days.extend(tail)
+            return days
+        return build_timeline(entries)
+
+    def store(self, entries: Sequence[MoodEntry], days: list[TimelineDay]) -> None:
+        """Remember ``days``, built by ``compute`` from ``entries``."""
+        self._entries = list(entries)
+        self._days = days
+
+    @property
+    def days(self) -> list[TimelineDay]:
+        """The cards as last built (or appended to)."""
+        return self._days
+
+    def append(self, entry: MoodEntry, window: int | None = None) -> int | None:
+        """Add one newly logged entry without rebuilding, keeping at most ``window``.
+
+        The cards are updated in place: the new row goes onto the last
+        card (today's) or a new one, and when the window slides the
+        oldest row leaves the first card. That costs one row, plus the
+        first card's rows when sliding, however long the history is.
+        Returns the index of the first card that changed, for
+        ``HistoryTimeline.show_days``, or ``None`` if the entry doesn't
+        go at the end, in which case the caller should rebuild from the
+        store.
+        """
+        entries = self._entries
+        if entries and entry.epoch < entries[-1].epoch:
+            return None
+        days = self._days
+        (added,) = build_timeline([entry], entries[-1] if entries else None)
+        if days and days[-1].day == added.day:
+            days[-1].rows.extend(added.rows)
+        else:
+            days.append(added)
+        changed = len(days) - 1
+        entries.append(entry)
+
+        if window is not None and len(entries) > window:
+            del entries[0]
+            del days[0].rows[0]
+            if not days[0].rows:
+                del days[0]
+            # Match a rebuild of the window, which can't see the entry
+            # before it and so shows no gap on the first row
+            rows = days[0].rows
+            rows[0] = replace(rows[0], gap=None)
+            changed = 0
+        return changed
+
+
 THEME_MASCOTS = {
     "Neon Midnight": """    ✨ ⭐
    (◕‿◕)
@@ -332,6 +583,7 @@ class HelpScreen(Screen):
                 "│  Actions:                                │\n"
                 "│    T  -  Cycle through themes            │\n"
                 "│    H  -  Toggle extended history view    │\n"
+                "│    ↑/↓ PgUp/PgDn  -  Scroll history      │\n"
                 "│    M  -  Monthly calendar view           │\n"
                 "│    E  -  Export data                     │\n"
                 "│    V  -  View full history               │\n"
@@ -349,95 +601,212 @@ class HelpScreen(Screen):
         self.app.pop_screen()
 
 
-class BorderRow(Static):
-    """A generic row with borders."""
+class RenderCache:
+    """Rendered lines of the themed box, shared by every line of the main screen.
+
+    Box and timeline lines are described by small hashable values (a
+    ``BoxLine``, a ``TimelineRow``, a date header). Rendered strips are
+    stored under (theme name, layout, that content, base style), so
+    identical lines share one strip: every blank row, every card border,
+    and a row that reads the same on two days. Cycling back to a theme or
+    resizing back to a width finds its lines still here. Least recently
+    used lines fall out once the cache is full.
+
+    ``hits`` and ``misses`` count lookups, to check how much work is reused.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self._strips: LRUCache[tuple, Strip] = LRUCache(maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def strip(
+        self,
+        theme_name: str,
+        layout: LayoutContext,
+        content: Hashable,
+        style: Style,
+        segments: Callable[[], list[Segment]],
+    ) -> Strip:
+        """The strip for ``content``, calling ``segments()`` to render it on a miss."""
+        key = (theme_name, layout, content, style)
+        strip = self._strips.get(key)
+        if strip is not None:
+            self.hits += 1
+            return strip
+        self.misses += 1
+        strip = Strip(segments()).apply_style(style)
+        self._strips[key] = strip
+        return strip
+
+    def clear(self) -> None:
+        self._strips.clear()
+        self.hits = self.misses = 0
+
+
+# Shared by the main screen's box and history timeline
+render_cache = RenderCache()
+
+
+@dataclass(frozen=True)
+class BoxLine:
+    """One line of the main box: a border, the divider, the selector or text."""
+    kind: str = "row"  # "top", "bottom", "divider", "selector" or "row"
+    text: str = ""  # row text, or the divider label
+    style: str | None = None  # style role for the text (default: "text")
+    centered: bool = False
+    selected: int = 0  # highlighted mood, for the selector
+
+
+class BoxSection(Widget):
+    """A run of lines of the main box, drawn with the line API.
+
+    The box used to be a stack of a dozen Static widgets (borders, rows,
+    divider, mood selector), each regenerating its markup on every
+    resize and theme change and each laid out and composited on its own.
+    A section holds the lines as ``BoxLine`` data instead. Their strips
+    come from the shared ``render_cache``, and when a line changes, only
+    that line is looked up and repainted again. Lines name style roles,
+    not colours, so a theme switch only swaps ``theme_styles``.
+    """
 
     def __init__(
         self,
-        content: str,
-        border_style,
-        palette,
-        style: str = None,
-        centered: bool = False,
+        lines: list[BoxLine],
+        layout: LayoutContext,
+        theme_styles: ThemeStyles,
         id: str = None,
     ):
         super().__init__(id=id)
-        self.content_text = content
-        self.border_style = border_style
-        self.palette = palette
-        self.custom_text_style = style
-        self.centered = centered
-        self.render_content()
+        self.layout_context = layout
+        self.theme_styles = theme_styles
+        self._lines = list(lines)
+        self._hidden: set[int] = set()
+        # Indices of the lines on screen, top to bottom
+        self._visible = list(range(len(self._lines)))
+        self.styles.height = "auto"
+
+    def set_theme(self, theme_styles: ThemeStyles) -> None:
+        """Redraw the same lines in another theme."""
+        self.theme_styles = theme_styles
+        self.refresh()
+
+    def set_layout(self, layout: LayoutContext) -> None:
+        """Redraw at a new box size."""
+        self.layout_context = layout
+        self.refresh(layout=True)
+
+    def set_line(self, index: int, line: BoxLine) -> None:
+        """Change one line, repainting just that line."""
+        if self._lines[index] == line:
+            return
+        self._lines[index] = line
+        if index not in self._hidden:
+            y = self._visible.index(index)
+            self.refresh(Region(0, y, self.size.width, 1))
 
-    def render_content(self):
-        inner_width = INNER_WIDTH
-        if self.centered:
-            content = self.content_text.center(inner_width)
-        else:
-            content = self.content_text.ljust(inner_width)
+    def is_line_visible(self, index: int) -> bool:
+        return index not in self._hidden
 
-        color = self.custom_text_style or self.palette.text_primary
-        # Apply color to content
-        content = f"[{color}]{content}[/]"
+    def set_line_visible(self, index: int, visible: bool) -> None:
+        if visible == (index not in self._hidden):
+            return
+        if visible:
+            self._hidden.discard(index)
+        else:
+            self._hidden.add(index)
+        self._update_visible()
+        self.refresh(layout=True)
+
+    def _update_visible(self) -> None:
+        self._visible = [i for i in range(len(self._lines)) if i not in self._hidden]
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        return self.layout_context.box_width
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        return len(self._visible)
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        if y >= len(self._visible):
+            return Strip.blank(width, self.rich_style)
+        line = self._lines[self._visible[y]]
+        strip = render_cache.strip(
+            self.theme_styles.name,
+            self.layout_context,
+            line,
+            self.rich_style,
+            lambda: self._line_segments(line),
+        )
+        return strip.crop_extend(0, width, self.rich_style)
+
+    def _line_segments(self, line: BoxLine) -> list[Segment]:
+        theme = self.theme_styles
+        b = theme.border_style
+        border = theme.style("border")
+        inner_width = self.layout_context.inner_width
+        if line.kind == "top":
+            return [Segment(f"{b.top_left}{b.horizontal * inner_width}{b.top_right}", border)]
+        if line.kind == "bottom":
+            return [Segment(f"{b.bottom_left}{b.horizontal * inner_width}{b.bottom_right}", border)]
+        if line.kind == "divider":
+            return [Segment(self._divider_text(line.text), border)]
+        if line.kind == "selector":
+            base = border + theme.style(line.style) if line.style else border
+            content = self._selector_segments(line.selected, base)
+        else:
+            if line.centered:
+                text = line.text.center(inner_width)
+            else:
+                text = line.text.ljust(inner_width)
+            content = [Segment(text, border + theme.style(line.style or "text"))]
 
         # Border - no spaces between border and content
-        border_color = self.border_style.border_color
-        line = f"[{border_color}]{self.border_style.vertical}{content}{self.border_style.vertical}[/]"
-        self.update(line)
+        return [Segment(b.vertical, border), *content, Segment(b.vertical, border)]
 
-    def update_content(self, content: str, style: str = None):
-        self.content_text = content
-        if style:
-            self.custom_text_style = style
-        self.render_content()
-
-
-class SectionDivider(Static):
-    def __init__(self, label: str, border_style):
-        super().__init__()
-        self.label = label
-        self.border_style = border_style
-        self.render_content()
-
-    def render_content(self):
-        label_with_spaces = f" {self.label} "
-        remaining = INNER_WIDTH - len(label_with_spaces)
+    def _divider_text(self, label: str) -> str:
+        label_with_spaces = f" {label} "
+        remaining = self.layout_context.inner_width - len(label_with_spaces)
         left_dashes = remaining // 2
         right_dashes = remaining - left_dashes
 
-        b = self.border_style
-        line = (
+        b = self.theme_styles.border_style
+        return (
             f"{b.divider_left}"
             f"{b.divider_horizontal * left_dashes}"
             f"{label_with_spaces}"
             f"{b.divider_horizontal * right_dashes}"
             f"{b.divider_right}"
         )
-        self.update(f"[{b.border_color}]{line}[/]")
-
-
-class TopBorder(Static):
-    def __init__(self, border_style):
-        super().__init__()
-        self.border_style = border_style
-        self.render_content()
 
-    def render_content(self):
-        b = self.border_style
-        line = f"{b.top_left}{b.horizontal * INNER_WIDTH}{b.top_right}"
-        self.update(f"[{b.border_color}]{line}[/]")
+    def _selector_segments(self, selected_index: int, base: Style) -> list[Segment]:
+        """The mood options in a row, colour-coded, with the selected one marked."""
+        theme = self.theme_styles
+        inner_width = self.layout_context.inner_width
+        options = []
+        visible_length = 0
 
+        for idx, (label, score) in enumerate(MOOD_OPTIONS):
+            color = bar_color_for_score(score)
 
-class BottomBorder(Static):
-    def __init__(self, border_style):
-        super().__init__()
-        self.border_style = border_style
-        self.render_content()
+            if idx == selected_index:
+                # Selected option: bold + arrows
+                text = f"► {label} ◄"
+                style = theme.style(f"bold {color}")
+            else:
+                text = f"■ {label}"
+                style = theme.style(color)
+            if options:
+                options.append(Segment("  ", base))
+                visible_length += 2
+            options.append(Segment(text, base + style))
+            visible_length += len(text)
 
-    def render_content(self):
-        b = self.border_style
-        line = f"{b.bottom_left}{b.horizontal * INNER_WIDTH}{b.bottom_right}"
-        self.update(f"[{b.border_color}]{line}[/]")
+        # Center, then pad out to the inner width
+        padding_needed = max(0, (inner_width - visible_length) // 2)
+        trailing = max(0, inner_width - padding_needed - visible_length)
+        return [Segment(" " * padding_needed, base), *options, Segment(" " * trailing, base)]
 
 
 class MoodOption(Static):
@@ -451,8 +820,10 @@ class MoodOption(Static):
         palette,
         is_selected: bool = False,
         centered: bool = True,
+        layout: LayoutContext = DEFAULT_LAYOUT,
     ):
         super().__init__()
+        self.layout_context = layout
         self.label = label
         self.score = score
         self.border_style = border_style
@@ -467,9 +838,9 @@ class MoodOption(Static):
 
         content = f"{marker} {self.label}"
         if self.centered:
-            content = content.center(INNER_WIDTH)
+            content = content.center(self.layout_context.inner_width)
         else:
-            content = content.ljust(INNER_WIDTH)
+            content = content.ljust(self.layout_context.inner_width)
 
         if self.is_selected:
             content = f"[bold {self.palette.accent_high}]{content}[/]"
@@ -486,9 +857,9 @@ class MoodOption(Static):
         marker = "(x)" if self.is_selected else "( )"
         content = f"{marker} {self.label}"
         if self.centered:
-            content = content.center(INNER_WIDTH)
+            content = content.center(self.layout_context.inner_width)
         else:
-            content = content.ljust(INNER_WIDTH)
+            content = content.ljust(self.layout_context.inner_width)
 
         if self.is_selected:
             c = color if color else self.palette.accent_high
@@ -505,154 +876,191 @@ class MoodOption(Static):
         self.update(line)
 
 
-class TimelineEntry(Static):
-    """Single mood entry in a timeline card."""
-
-    def __init__(
-        self,
-        time_str: str,
-        mood_label: str,
-        bar_length: int,
-        color: str,
-        border_style,
-        palette,
-        frequency_str: str = None,
-    ):
-        super().__init__()
-        self.time_str = time_str
-        self.mood_label = mood_label
-        self.bar_length = bar_length
-        self.color = color
-        self.border_style = border_style
-        self.palette = palette
-        self.frequency_str = frequency_str
-        self._update_display()
-
-    def _update_display(self):
-        """Update the entry display."""
+class HistoryTimeline(ScrollView):
+    """The history list as one scrollable widget drawn with the line API.
+
+    Mounting a widget per row and per card border meant thousands of DOM
+    nodes once the extended view showed years of moods. Here the cards
+    are kept as plain ``TimelineDay`` data and each line is only turned
+    into a strip when it scrolls into view, so memory and paint cost
+    follow the viewport height rather than the history length.
+
+    Strips come from the shared ``render_cache`` keyed by what a line
+    shows, so when cards are added, removed or swapped only lines that
+    were never drawn before are rendered; cards that merely moved up or
+    down, borders and repeated rows reuse existing strips.
+    """
+
+    DEFAULT_CSS = """
+    HistoryTimeline {
+        width: 100%;
+        /* Whatever the box has left between its header and footer; the
+           extended view scrolls inside it rather than stretching the box */
+        height: 1fr;
+        overflow-x: hidden;
+        /* The box borders are drawn into each line, so keep a scrollbar out of them */
+        scrollbar-size-vertical: 0;
+    }
+    """
+
+    def __init__(self, layout: LayoutContext, theme_styles: ThemeStyles, id: str = None):
+        super().__init__(id=id)
+        self.layout_context = layout
+        self.theme_styles = theme_styles
+        self._days: list[TimelineDay] = []
+        # First line of each card, for finding the card under a line
+        self._starts: list[int] = []
+        self._line_count = 0
+        self._message: tuple[str, str] | None = None
+
+    def show_message(self, text: str, style: str = "text") -> None:
+        """Show a single centred line (loading, empty history) instead of cards."""
+        self._message = (text, style)
+        self._days = []
+        self._starts = []
+        self._set_line_count(1)
+        self.refresh()
+
+    def show_days(self, days: list[TimelineDay], changed: int | None = None) -> None:
+        """Show ``days`` as date cards (oldest first), repainting only what changed.
+
+        Cards are compared by identity: ``TimelineCache`` hands back the
+        same ``TimelineDay`` objects for cards it didn't touch, so the
+        first card that isn't the old one marks where repainting starts.
+        After ``TimelineCache.append`` updated the shown cards in place,
+        pass the index it returned as ``changed`` instead.
+        """
+        redraw = self._message is not None
+        self._message = None
+        old_days = self._days
+        same = 0
+        if not redraw:
+            if changed is not None:
+                same = changed
+            else:
+                for old, new in zip(old_days, days):
+                    if old is not new:
+                        break
+                    same += 1
+
+        old_count = self._line_count
+        starts = self._starts[:same]
+        line = starts[-1] + len(days[same - 1].rows) + 4 if same else 0
+        for day in days[same:]:
+            starts.append(line)
+            # Date header, card top, one line per row, card bottom, blank
+            line += len(day.rows) + 4
+        self._days = days
+        self._starts = starts
+        self._set_line_count(line)
+
+        if same == len(days) == len(old_days) and not redraw:
+            return
+        first_changed = starts[same] if same < len(days) else line
+        self._refresh_lines(first_changed, max(line, old_count))
+
+    def set_theme(self, theme_styles: ThemeStyles) -> None:
+        """Redraw the same cards in another theme."""
+        self.theme_styles = theme_styles
+        self.refresh()
+
+    def set_layout(self, layout: LayoutContext) -> None:
+        """Redraw at a new box size (strips for it come from the render cache)."""
+        self.layout_context = layout
+        self.virtual_size = Size(layout.box_width, self._line_count)
+        self.refresh()
+
+    def _set_line_count(self, count: int) -> None:
+        self._line_count = count
+        size = Size(self.layout_context.box_width, count)
+        # A new virtual size means a new layout and a full repaint, so
+        # leave it alone when the number of lines hasn't changed
+        if self.virtual_size != size:
+            self.virtual_size = size
+
+    def _refresh_lines(self, start: int, end: int) -> None:
+        """Repaint timeline lines ``start`` up to ``end`` if they're on screen."""
+        scroll_y = self.scroll_offset.y
+        top = max(0, start - scroll_y)
+        bottom = min(self.size.height, end - scroll_y)
+        if bottom > top:
+            self.refresh(Region(0, top, self.size.width, bottom - top))
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = y + scroll_y
+        width = self.size.width
+        if index >= self._line_count:
+            return Strip.blank(width, self.rich_style)
+        if self._message is not None:
+            content = ("message", *self._message)
+        else:
+            position = bisect_right(self._starts, index) - 1
+            content = self._line_content(
+                self._days[position], index - self._starts[position]
+            )
+        strip = render_cache.strip(
+            self.theme_styles.name,
+            self.layout_context,
+            content,
+            self.rich_style,
+            lambda: self._line_segments(content),
+        )
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+    @staticmethod
+    def _line_content(day: TimelineDay, offset: int) -> Hashable:
+        """What line ``offset`` of the card for ``day`` shows."""
+        if offset == 0:
+            return ("date", day.date_str)
+        if offset == 1:
+            return ("top",)
+        if offset - 2 < len(day.rows):
+            return day.rows[offset - 2]
+        if offset - 2 == len(day.rows):
+            return ("bottom",)
+        # Empty line between cards
+        return ("blank",)
+
+    def _line_segments(self, content: Hashable) -> list[Segment]:
+        """The segments of a line showing ``content``."""
+        b = self.theme_styles.border_style
+        inner_width = self.layout_context.inner_width
+        if isinstance(content, TimelineRow):
+            return self._row_segments(content, inner_width)
+        kind = content[0]
+        if kind == "message":
+            _, text, style = content
+            return self._bordered(text.center(inner_width), style)
+        if kind == "date":
+            return self._bordered(content[1].ljust(inner_width), "heading")
+        border = self.theme_styles.style("border")
+        if kind == "top":
+            return [Segment(f"{b.top_left}{b.horizontal * inner_width}{b.top_right}", border)]
+        if kind == "bottom":
+            return [Segment(f"{b.bottom_left}{b.horizontal * inner_width}{b.bottom_right}", border)]
+        return self._bordered(" " * inner_width, "text")
+
+    def _row_segments(self, row: TimelineRow, inner_width: int) -> list[Segment]:
         # Add spacing between bar blocks
-        bar_blocks = " ".join(["█" for _ in range(self.bar_length)])
+        bar_blocks = " ".join(["█" for _ in range(row.bar_length)])
 
-        # Build line with frequency if available
-        if self.frequency_str:
-            line_text = f"{self.time_str:<9}  {bar_blocks:<20}  {self.mood_label:<8}  [{self.frequency_str}]"
+        # Build line with the gap since the previous mood if there is one
+        if row.gap:
+            line_text = f"{row.time_str:<9}  {bar_blocks:<20}  {row.label:<8}  [{row.gap}]"
         else:
-            line_text = f"{self.time_str:<9}  {bar_blocks:<20}  {self.mood_label}"
+            line_text = f"{row.time_str:<9}  {bar_blocks:<20}  {row.label}"
+        return self._bordered(line_text.ljust(inner_width), row.color)
 
-        # Pad and border
-        content = line_text.ljust(INNER_WIDTH)
-        content = f"[{self.color}]{content}[/]"
-
-        border_color = self.border_style.border_color
-        line = f"[{border_color}]{self.border_style.vertical}{content}{self.border_style.vertical}[/]"
-        self.update(line)
-
-
-class TimelineCardTop(Static):
-    """Top border of a timeline card."""
-
-    def __init__(self, border_style):
-        super().__init__()
-        self.border_style = border_style
-        self.render_content()
-
-    def render_content(self):
-        b = self.border_style
-        # Use box drawing characters for card top
-        line = f"{b.top_left}{b.horizontal * INNER_WIDTH}{b.top_right}"
-        self.update(f"[{b.border_color}]{line}[/]")
-
-
-class TimelineCardBottom(Static):
-    """Bottom border of a timeline card."""
-
-    def __init__(self, border_style):
-        super().__init__()
-        self.border_style = border_style
-        self.render_content()
-
-    def render_content(self):
-        b = self.border_style
-        # Use box drawing characters for card bottom
-        line = f"{b.bottom_left}{b.horizontal * INNER_WIDTH}{b.bottom_right}"
-        self.update(f"[{b.border_color}]{line}[/]")
-
-
-class TimelineDateHeader(Static):
-    """Date header for timeline cards."""
-
-    def __init__(self, date_str: str, border_style, palette):
-        super().__init__()
-        self.date_str = date_str
-        self.border_style = border_style
-        self.palette = palette
-        self.render_content()
-
-    def render_content(self):
-        line_text = f"{self.date_str}"
-        content = line_text.ljust(INNER_WIDTH)
-        content = f"[bold {self.palette.accent_high}]{content}[/]"
-
-        border_color = self.border_style.border_color
-        line = f"[{border_color}]{self.border_style.vertical}{content}{self.border_style.vertical}[/]"
-        self.update(line)
-
-
-class HorizontalMoodSelector(Static):
-    """Horizontal mood selector with color-coded options."""
-
-    def __init__(self, border_style, palette, selected_index: int = 0):
-        super().__init__()
-        self.border_style = border_style
-        self.palette = palette
-        self.selected_index = selected_index
-        self.render_content()
-
-    # Removed duplicate inner class definition that caused 'self' to be undefined
-
-    def render_content(self):
-        # Build mood options from MOOD_OPTIONS
-        options = []
-        visible_parts = []
-
-        for idx, (label, score) in enumerate(MOOD_OPTIONS):
-            color = bar_color_for_score(score)
-
-            if idx == self.selected_index:
-                # Selected option: bold + arrows
-                text = f"► {label} ◄"
-                options.append(f"[bold {color}]{text}[/]")
-                visible_parts.append(text)
-            else:
-                text = f"■ {label}"
-                options.append(f"[{color}]{text}[/]")
-                visible_parts.append(text)
-
-        selector_text = "  ".join(options)
-        visible_text = "  ".join(visible_parts)
-
-        # Center based on visible length (no markup)
-        visible_length = len(visible_text)
-        padding_needed = max(0, (INNER_WIDTH - visible_length) // 2)
-        padding = " " * padding_needed
-
-        content = f"{padding}{selector_text}"
-        content = content.ljust(INNER_WIDTH)
-
-        border_color = self.border_style.border_color
-        line = f"[{border_color}]{self.border_style.vertical}{content}{self.border_style.vertical}[/]"
-        self.update(line)
-
-    def set_selected(self, index: int):
-        """Update the selected mood index with animation."""
-        self.selected_index = index
-        self.render_content()
-
-        # Chaotic-cute pulse animation
-        self.styles.animate("opacity", value=0.7, duration=0.1, easing="out_cubic")
-        self.styles.animate(
-            "opacity", value=1.0, duration=0.15, delay=0.1, easing="in_out_cubic"
-        )
+    def _bordered(self, content: str, style: str) -> list[Segment]:
+        """``content`` in ``style`` (a role or a colour) between two borders."""
+        vertical = self.theme_styles.border_style.vertical
+        border = self.theme_styles.style("border")
+        return [
+            Segment(vertical, border),
+            Segment(content, border + self.theme_styles.style(style)),
+            Segment(vertical, border),
+        ]
 
 
 class HistoryBar(Static):
@@ -666,8 +1074,10 @@ class HistoryBar(Static):
         color: str,
         border_style,
         palette,
+        layout: LayoutContext = DEFAULT_LAYOUT,
     ):
         super().__init__()
+        self.layout_context = layout
         self.date_str = date_str
         self.ascii_face = ascii_face
         self.final_length = final_length
@@ -683,7 +1093,7 @@ class HistoryBar(Static):
         line_text = f"{self.date_str}: {self.ascii_face:<4} {bar}"
 
         # Pad and border
-        content = line_text.ljust(INNER_WIDTH)
+        content = line_text.ljust(self.layout_context.inner_width)
         content = f"[{self.color}]{content}[/]"
 
         border_color = self.border_style.border_color
@@ -736,24 +1146,20 @@ class MainScreen(Screen):
     show_extended_history = False  # Toggle between 12 entries and all entries
     _mood_widgets = []  # Track mood option widgets
     _history_bars = []  # Track history bar widgets
+    _resize_timer: Timer | None = None  # Pending relayout after a resize
+    layout_context = DEFAULT_LAYOUT  # Box geometry for the current screen size
+
+    def _update_layout(self) -> None:
+        """Lay the box out for the current screen size."""
+        layout = LayoutContext.for_terminal(self.size.width)
+        # The box width is clamped, so most resizes of a wide or narrow
+        # terminal don't change it and there is nothing to redo
+        if layout == self.layout_context:
+            return
+        self.layout_context = layout
 
-    def _calculate_box_width(self) -> int:
-        """Calculate optimal box width based on terminal size."""
-        terminal_width = self.size.width
-
-        # Leave some margin on each side (10% on each side minimum)
-        available_width = int(terminal_width * 0.8)
-
-        # Constrain to min/max bounds
-        box_width = max(MIN_BOX_WIDTH, min(available_width, MAX_BOX_WIDTH))
-
-        return box_width
-
-    def _update_box_dimensions(self) -> None:
-        """Update box dimensions based on current screen size."""
-        global BOX_WIDTH, INNER_WIDTH
-        BOX_WIDTH = self._calculate_box_width()
-        INNER_WIDTH = BOX_WIDTH - 2
+        # Refresh all components that depend on width
+        self._refresh_all_components()
 
     def _apply_padding(self, text: str, padding: int) -> str:
         return " " * padding + text
@@ -761,7 +1167,7 @@ class MainScreen(Screen):
     def _get_centered_padding(self) -> int:
         """Calculate left padding needed to center the box on the screen."""
         terminal_width = self.size.width
-        box_width = BOX_WIDTH
+        box_width = self.layout_context.box_width
         padding = max(
             0, (terminal_width - box_width) // 2
         )  # Calculate padding, ensuring it's never negative
@@ -775,7 +1181,7 @@ class MainScreen(Screen):
         """
         return (
             self.border_style.top_left
-            + self.border_style.horizontal * INNER_WIDTH
+            + self.border_style.horizontal * self.layout_context.inner_width
             + self.border_style.top_right
         )
 
@@ -787,7 +1193,7 @@ class MainScreen(Screen):
         """
         return (
             self.border_style.bottom_left
-            + self.border_style.horizontal * INNER_WIDTH
+            + self.border_style.horizontal * self.layout_context.inner_width
             + self.border_style.bottom_right
         )
 
@@ -798,7 +1204,7 @@ class MainScreen(Screen):
         The characters come from the theme's BorderStyle, and the label is centered.
         """
         label_with_spaces = f" {label} "
-        remaining = INNER_WIDTH - len(label_with_spaces)
+        remaining = self.layout_context.inner_width - len(label_with_spaces)
         left_dashes = remaining // 2
         right_dashes = remaining - left_dashes
 
@@ -832,17 +1238,20 @@ class MainScreen(Screen):
 
     def compose(self) -> ComposeResult:
         self.preferences = load_preferences()
-        self.theme_names = list(THEMES.keys())
+        self.theme_names = theme_names()
         try:
             self.theme_index = self.theme_names.index(self.preferences.current_theme)
         except ValueError:
             self.theme_index = self.theme_names.index(DEFAULT_THEME_NAME)
 
-        self.palette = get_palette(self.theme_names[self.theme_index])
-        self.border_style = get_border_style(self.theme_names[self.theme_index])
+        self.theme_styles = compile_theme(self.theme_names[self.theme_index])
+        self.palette = self.theme_styles.palette
+        self.border_style = self.theme_styles.border_style
         self.selected_index = self.preferences.last_selected_mood_index
         self.show_history = self.preferences.show_history_panel
-        self.sound_manager = SoundManager()
+        self.sound_manager = SoundManager(fallback=self.app.bell)
+        self._footer_text = ""
+        self.layout_context = LayoutContext.for_terminal(self.app.size.width)
 
         with Vertical():
             self.mood_companion = MoodCompanion(initial_score=5)
@@ -850,70 +1259,79 @@ class MainScreen(Screen):
             yield self.mood_companion
 
             with Vertical(id="box-container"):
-                yield TopBorder(self.border_style)
-
-                today_str = date.today().isoformat()
-                yield BorderRow(
-                    f"Date: {today_str}", self.border_style, self.palette, centered=True
+                # Everything above the history list, then the list, then
+                # the footer and bottom border
+                self.box_header = BoxSection(
+                    self._box_header_lines(),
+                    self.layout_context,
+                    self.theme_styles,
+                    id="box-header",
                 )
-                yield BorderRow("", self.border_style, self.palette)
-
-                yield BorderRow(
-                    "How are you feeling today?",
-                    self.border_style,
-                    self.palette,
-                    style=f"bold {self.palette.accent_high}",
-                    centered=True,
-                )
-                yield BorderRow("", self.border_style, self.palette)
-                yield BorderRow(
-                    "[←/→ to select, Enter to confirm]",
-                    self.border_style,
-                    self.palette,
-                    style=self.palette.text_muted,
-                    centered=True,
+                yield self.box_header
+
+                self.history_timeline = HistoryTimeline(
+                    self.layout_context,
+                    self.theme_styles,
+                    id="history-list",
                 )
-                yield BorderRow("", self.border_style, self.palette)
+                yield self.history_timeline
 
-                # Horizontal Mood Selector
-                self.horizontal_selector = HorizontalMoodSelector(
-                    self.border_style, self.palette, self.selected_index
+                self.box_footer = BoxSection(
+                    self._box_footer_lines(),
+                    self.layout_context,
+                    self.theme_styles,
+                    id="box-footer",
                 )
-                yield self.horizontal_selector
+                yield self.box_footer
 
                 # Keep mood_options list for compatibility
                 self.mood_options = []
 
-                yield BorderRow("", self.border_style, self.palette)
-                yield BorderRow("", self.border_style, self.palette)
-
-                # History Section
-                self.history_divider = SectionDivider("Mood History", self.border_style)
-                yield self.history_divider
-
-                with Vertical(id="history-list"):
-                    pass
-
-                self.history_footer = BorderRow(
-                    "",
-                    self.border_style,
-                    self.palette,
-                    style=self.palette.accent_low,
-                    id="history-footer",
-                    centered=True,
-                )
-                yield self.history_footer
-                yield BorderRow("", self.border_style, self.palette)
-                yield BorderRow("", self.border_style, self.palette)
-
-                yield BottomBorder(self.border_style)
-
             self.toast = ToastNotification()
             yield self.toast
 
+    def _box_header_lines(self) -> list[BoxLine]:
+        """Lines of the box above the history list."""
+        today_str = date.today().isoformat()
+        return [
+            BoxLine("top"),
+            BoxLine(text=f"Date: {today_str}", centered=True),
+            BoxLine(),
+            BoxLine(
+                text="How are you feeling today?",
+                style="heading",
+                centered=True,
+            ),
+            BoxLine(),
+            BoxLine(
+                text="[←/→ to select, Enter to confirm]",
+                style="muted",
+                centered=True,
+            ),
+            BoxLine(),
+            # Horizontal Mood Selector
+            BoxLine("selector", selected=self.selected_index),
+            BoxLine(),
+            BoxLine(),
+            # History Section
+            BoxLine("divider", "Mood History"),
+        ]
+
+    def _box_footer_lines(self) -> list[BoxLine]:
+        """Lines of the box below the history list."""
+        return [
+            self._footer_line(self._footer_text),
+            BoxLine(),
+            BoxLine(),
+            BoxLine("bottom"),
+        ]
+
+    def _footer_line(self, text: str) -> BoxLine:
+        return BoxLine(text=text, style="accent_low", centered=True)
+
     def on_mount(self) -> None:
         # Calculate initial dimensions
-        self._update_box_dimensions()
+        self._update_layout()
 
         # Initialize mood companion
         _, initial_score = MOOD_OPTIONS[self.selected_index]
@@ -921,39 +1339,40 @@ class MainScreen(Screen):
 
         # Ensure history is visible by default
         self.show_history = True
+        # One timeline cache per view, so toggling doesn't throw work away
+        self._timeline_caches = {False: TimelineCache(), True: TimelineCache()}
+        # Which view the list last showed (None until the first load)
+        self._history_view: bool | None = None
+        # Numbers in the footer (None until the first load), so a theme
+        # switch can rewrite it without going back to the store
+        self._footer_stats: tuple[int, int] | None = None
         self._refresh_history()
         self._update_history_visibility()
 
     def on_resize(self, event) -> None:
-        """Handle terminal resize to update UI dynamically."""
-        # Recalculate dimensions
-        self._update_box_dimensions()
+        """Handle terminal resize to update UI dynamically.
 
-        # Refresh all components that depend on width
-        self._refresh_all_components()
-
-    def _refresh_all_components(self) -> None:
-        """Refresh all UI components to reflect new dimensions."""
-        # Update borders
-        try:
-            self.query_one(TopBorder).render_content()
-            self.query_one(BottomBorder).render_content()
-
-            # Update dividers
-            self.history_divider.render_content()
+        Dragging a terminal edge sends a burst of resize events, so each
+        one just restarts a short timer and only the last of the burst
+        (at most one per frame) gets to lay the box out again.
+        """
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(RESIZE_DEBOUNCE, self._apply_resize)
 
-            # Update all border rows
-            for row in self.query(BorderRow):
-                row.render_content()
+    def _apply_resize(self) -> None:
+        self._resize_timer = None
+        self._update_layout()
 
-            # Update horizontal selector
-            self.horizontal_selector.render_content()
+    def _refresh_all_components(self) -> None:
+        """Refresh all UI components to reflect new dimensions.
 
-            # Refresh history
-            self._refresh_history()
-        except Exception:
-            # If any widgets don't exist yet, just skip
-            pass
+        Nothing is reloaded: the lines are already in memory, and the
+        render cache keeps strips per width, so going back to a width
+        seen before costs no rendering either.
+        """
+        for widget in (self.box_header, self.history_timeline, self.box_footer):
+            widget.set_layout(self.layout_context)
 
     async def on_key(self, event: events.Key) -> None:
         """Handle keyboard input for navigation and actions."""
@@ -977,151 +1396,180 @@ class MainScreen(Screen):
             self._refresh_history()
 
             # Toggle footer visibility too
-            if self.history_footer.styles.display == "block":
-                self.history_footer.styles.display = "none"
+            self.box_footer.set_line_visible(
+                FOOTER_LINE, not self.box_footer.is_line_visible(FOOTER_LINE)
+            )
+
+        elif key in ("up", "down", "pageup", "pagedown") and self.show_extended_history:
+            # Scroll the extended history
+            timeline = self.history_timeline
+            if key == "up":
+                timeline.scroll_up(animate=False)
+            elif key == "down":
+                timeline.scroll_down(animate=False)
+            elif key == "pageup":
+                timeline.scroll_page_up(animate=False)
             else:
-                self.history_footer.styles.display = "block"
+                timeline.scroll_page_down(animate=False)
 
         elif key == "question_mark":
             self.app.push_screen(HelpScreen())
 
+        # Secondary screens are imported on first use, to keep them off
+        # the path to the first frame
         elif key == "e":
+            from .export import ExportScreen
+
             self.app.push_screen(ExportScreen(self.palette))
 
         elif key == "v":
+            from .history import HistoryScreen
+
             self.app.push_screen(HistoryScreen())
 
         elif key == "m":
+            from .calendar import MonthlyCalendarScreen
+
             self.app.push_screen(MonthlyCalendarScreen(self.palette, self.border_style))
 
     def _change_selection(self, delta: int):
         self.selected_index = (self.selected_index + delta) % len(MOOD_OPTIONS)
         self.preferences.last_selected_mood_index = self.selected_index
         save_preferences(self.preferences)
-        self.sound_manager.play_selection()
+        _, score = MOOD_OPTIONS[self.selected_index]
+        self.sound_manager.play_selection(score)
 
         # Update mood companion
         _, score = MOOD_OPTIONS[self.selected_index]
         self.mood_companion.update_mood(score)
 
         # Update horizontal selector
-        self.horizontal_selector.set_selected(self.selected_index)
+        self._pulse_selector()
+
+    def _pulse_selector(self) -> None:
+        """Show the newly selected mood with a quick dim-and-back pulse."""
+        self.box_header.set_line(
+            SELECTOR_LINE, BoxLine("selector", style="dim", selected=self.selected_index)
+        )
+        self.set_timer(
+            0.1,
+            lambda: self.box_header.set_line(
+                SELECTOR_LINE, BoxLine("selector", selected=self.selected_index)
+            ),
+        )
 
     def _update_history_visibility(self):
-        history_list = self.query_one("#history-list")
+        self.box_header.set_line_visible(DIVIDER_LINE, self.show_history)
+        self.history_timeline.display = self.show_history
+        self.box_footer.set_line_visible(FOOTER_LINE, self.show_history)
+
+    @work(exclusive=True, group="history")
+    async def _refresh_history(self) -> None:
+        """Reload the history list off the event loop, then redraw it.
+
+        Entries and footer numbers are read, and the cards built, on
+        worker threads, so a large history never freezes the first paint
+        or a resize. Until
+        the first load finishes the list shows a placeholder row; after
+        that the old cards stay up until the new ones are ready. A newer
+        refresh cancels one still in flight.
+        """
+        if self._history_view is None:
+            self.history_timeline.show_message(
+                "Loading your mood history…", "placeholder"
+            )
 
-        if self.show_history:
-            self.history_divider.styles.display = "block"
-            history_list.styles.display = "block"
-            self.history_footer.styles.display = "block"
+        # Show last 12 entries (or all if extended view), oldest first;
+        # the compact view only reads the newest months
+        extended = self.show_extended_history
+        if extended:
+            last_entries = await query_moods_async()
         else:
-            self.history_divider.styles.display = "none"
-            history_list.styles.display = "none"
-            self.history_footer.styles.display = "none"
-
-    def _refresh_history(self) -> None:
-        """Refresh the history list with grouped timeline cards."""
-        entries = load_moods()
-        history_list = self.query_one("#history-list")
-        history_list.remove_children()
-
-        if not entries:
-            history_list.mount(
-                BorderRow(
-                    "No mood history yet. Log something above to get started.",
-                    self.border_style,
-                    self.palette,
-                    style=f"dim {self.palette.text_muted}",
-                    centered=True,
-                )
-            )
-            self._update_history_footer(entries)
+            last_entries = await query_moods_async(limit=HISTORY_PREVIEW_LENGTH, reverse=True)
+            last_entries = last_entries[::-1]
+        total, streak = await asyncio.to_thread(self._history_stats)
+        # Building the cards takes a while for a long history, so it
+        # happens on a thread too; the cache only takes the result if
+        # this refresh wasn't cancelled in the meantime
+        cache = self._timeline_caches[extended]
+        days = await asyncio.to_thread(cache.compute, last_entries)
+        cache.store(last_entries, days)
+        self._render_history(days, total, streak)
+
+    @work(exclusive=True, group="history")
+    async def _append_to_history(self, entry: MoodEntry) -> None:
+        """Add a just-saved mood to the history list without rebuilding it.
+
+        The new row goes onto today's card (or a new card) and, in the
+        compact view, the oldest row drops off the top; the timeline
+        then repaints only the lines that changed.
+        """
+        extended = self.show_extended_history
+        cache = self._timeline_caches[extended]
+        changed = None
+        if self._history_view == extended:
+            window = None if extended else HISTORY_PREVIEW_LENGTH
+            changed = cache.append(entry, window)
+        if changed is None:
+            self._refresh_history()
             return
 
-        # Show last 12 entries (or all if extended view)
-        display_count = len(entries) if self.show_extended_history else 12
-        last_entries = entries[-display_count:]
-
-        # Group entries by date
-        from collections import defaultdict
-
-        entries_by_date = defaultdict(list)
-        for entry in last_entries:
-            date_key = entry.timestamp.strftime("%b %d")  # "Nov 22"
-            entries_by_date[date_key].append(entry)
-
-        # Render grouped timeline cards
-        for date_str in entries_by_date.keys():
-            # Date header
-            history_list.mount(
-                TimelineDateHeader(date_str, self.border_style, self.palette)
+        timeline = self.history_timeline
+        # Keep following the newest moods if we were already at the bottom
+        follow = extended and timeline.is_vertical_scroll_end
+        timeline.show_days(cache.days, changed)
+        if follow:
+            timeline.scroll_end(animate=False)
+        total, streak = await asyncio.to_thread(self._history_stats)
+        self._update_history_footer(total, streak)
+
+    def _history_stats(self) -> tuple[int, int]:
+        """Total entry count and current streak (blocking; run in a thread)."""
+        rollups = load_rollups()
+        return rollups.overall.count, self._calculate_streak(rollups)
+
+    def _render_history(self, days: list[TimelineDay], total: int, streak: int) -> None:
+        """Redraw the history list with the given timeline cards."""
+        timeline = self.history_timeline
+        extended = self.show_extended_history
+        switched = timeline.has_class("-extended") != extended
+        # The list keeps its height in both views; the extended one
+        # scrolls inside it rather than stretching the box
+        timeline.set_class(extended, "-extended")
+        self._history_view = extended
+
+        if not days:
+            timeline.show_message(
+                "No mood history yet. Log something above to get started.",
+                "placeholder",
             )
+            self._update_history_footer(total, streak)
+            return
 
-            # Card top border
-            history_list.mount(TimelineCardTop(self.border_style))
-
-            # Each mood entry for this day
-            day_entries = entries_by_date[date_str]
-            for idx, entry in enumerate(day_entries):
-                time_str = entry.timestamp.strftime("%I:%M %p")  # "08:00 AM"
-                mood_label = self._label_for_score(entry.score)
-                bar_length = self._fixed_bar_length_for_score(entry.score)
-                color = self._bar_color_for_score(entry.score)
-
-                # Calculate frequency (time since previous entry)
-                frequency_str = None
-                if idx > 0:
-                    prev_entry = day_entries[idx - 1]
-                    time_gap = (entry.timestamp - prev_entry.timestamp).total_seconds()
-                    frequency_str = self._format_time_gap(time_gap)
-                elif len(last_entries) > len(day_entries):
-                    # Check if there's a previous entry from another day
-                    entry_index = last_entries.index(entry)
-                    if entry_index > 0:
-                        prev_entry = last_entries[entry_index - 1]
-                        time_gap = (
-                            entry.timestamp - prev_entry.timestamp
-                        ).total_seconds()
-                        frequency_str = self._format_time_gap(time_gap)
-
-                timeline_entry = TimelineEntry(
-                    time_str,
-                    mood_label,
-                    bar_length,
-                    color,
-                    self.border_style,
-                    self.palette,
-                    frequency_str,
-                )
-                history_list.mount(timeline_entry)
+        # The timeline only draws the lines that are on screen
+        timeline.show_days(days)
+        if switched:
+            # Newest moods are at the bottom
+            timeline.scroll_end(animate=False)
 
-            # Card bottom border
-            history_list.mount(TimelineCardBottom(self.border_style))
+        # Update footer with stats
+        self._update_history_footer(total, streak)
 
-            # Empty line between cards
-            history_list.mount(BorderRow("", self.border_style, self.palette))
+    def _calculate_streak(self, rollups: Rollups) -> int:
+        """Count consecutive days, ending today, that averaged above Meh (> 5).
 
-        # Update footer with stats
-        self._update_history_footer(entries)
+        The store's streak tracker keeps this up to date as moods are
+        logged, so it costs the same however long the history is. Days
+        with several entries count once, judged on their average.
+        """
+        return rollups.streaks["above_meh"].current(date.today())
 
-    def _update_history_footer(self, entries) -> None:
+    def _update_history_footer(self, total: int, streak: int) -> None:
         """Update the history footer with streak and stats."""
-        if not entries:
+        self._footer_stats = (total, streak)
+        if not total:
             footer_text = "No entries yet"
         else:
-            total = len(entries)
-
-            # Calculate streak (consecutive days above Meh = score > 5)
-            streak = 0
-            today = datetime.now().date()
-            for i in range(len(entries) - 1, -1, -1):
-                entry_date = entries[i].timestamp.date()
-                # Check if it's a consecutive day
-                if (today - entry_date).days == streak and entries[i].score > 5:
-                    streak += 1
-                else:
-                    break
-
             # Get current theme name
             theme_name = self._current_theme_name().replace("_", " ").title()
 
@@ -1130,13 +1578,15 @@ class MainScreen(Screen):
             else:
                 footer_text = f"{total} moods logged | Theme: {theme_name}"
 
-        self.history_footer.update_content(footer_text, style=self.palette.accent_low)
+        self._footer_text = footer_text
+        self.box_footer.set_line(FOOTER_LINE, self._footer_line(footer_text))
 
     def _cycle_theme(self) -> None:
         """Cycle through available themes and update the UI."""
         self.theme_index = (self.theme_index + 1) % len(self.theme_names)
-        self.palette = get_palette(self.theme_names[self.theme_index])
-        self.border_style = get_border_style(self.theme_names[self.theme_index])
+        self.theme_styles = compile_theme(self.theme_names[self.theme_index])
+        self.palette = self.theme_styles.palette
+        self.border_style = self.theme_styles.border_style
         self.preferences.current_theme = self.theme_names[self.theme_index]
         save_preferences(self.preferences)
 
@@ -1144,6 +1594,8 @@ class MainScreen(Screen):
         theme_name = self._current_theme_name()
         display_name = " ".join(word.capitalize() for word in theme_name.split("_"))
         mascot_art = THEME_MASCOTS.get(display_name, "No mascot available")
+        from .theme_mascot_popup import ThemeMascotPopup
+
         self.app.push_screen(ThemeMascotPopup(display_name, mascot_art, self.palette))
 
         # Update the mood companion
@@ -1151,26 +1603,11 @@ class MainScreen(Screen):
         _, score = MOOD_OPTIONS[self.selected_index]
         self.mood_companion.update_mood(score)
 
-        # Update Top/Bottom borders
-        self.query_one(TopBorder).border_style = self.border_style
-        self.query_one(TopBorder).render_content()
-        self.query_one(BottomBorder).border_style = self.border_style
-        self.query_one(BottomBorder).render_content()
-
-        # Update Divider
-        self.history_divider.border_style = self.border_style
-        self.history_divider.render_content()
-
-        # Update BorderRows
-        for row in self.query(BorderRow):
-            row.border_style = self.border_style
-            row.palette = self.palette
-            row.render_content()
-
-        # Update HorizontalMoodSelector
-        self.horizontal_selector.border_style = self.border_style
-        self.horizontal_selector.palette = self.palette
-        self.horizontal_selector.render_content()
+        # Swap the style table; every line keeps its content and the
+        # strips for this theme come from the render cache
+        self.box_header.set_theme(self.theme_styles)
+        self.history_timeline.set_theme(self.theme_styles)
+        self.box_footer.set_theme(self.theme_styles)
 
         # Update MoodOptions (kept for compatibility)
         for opt in self.mood_options:
@@ -1178,31 +1615,38 @@ class MainScreen(Screen):
             opt.palette = self.palette
             opt.render_content()
 
-        # Update HistoryBars
-        self._refresh_history()
+        # Only the theme name in the footer changed
+        if self._footer_stats is not None:
+            self._update_history_footer(*self._footer_stats)
 
     def _current_theme_name(self) -> str:
         return self.theme_names[self.theme_index]
 
-    @work(exclusive=True)
+    # Not exclusive: a second save must not cancel one that is still
+    # waiting on the disk, or its mood would never reach the timeline
+    @work(exclusive=False)
     async def _save_current_mood(self) -> None:
         label, score = MOOD_OPTIONS[self.selected_index]
+        from .reflection import ReflectionPromptScreen
 
         note_text = await self.app.push_screen_wait(
             ReflectionPromptScreen(label, score, self.palette)
         )
 
-        entries = load_moods()
-        entries.append(
-            MoodEntry(
-                timestamp=datetime.now(),
-                score=score,
-                tag=None,
-                note=note_text,
-            )
+        entry = MoodEntry(
+            timestamp=datetime.now(),
+            score=score,
+            tag=None,
+            note=note_text,
         )
-        save_moods(entries)
-        self.sound_manager.play_save()
+        # The write happens on background threads; wait for it here (in
+        # this worker, not the event loop) so we only confirm a durable save
+        try:
+            await append_mood_async(entry)
+        except OSError as exc:
+            self.notify(f"Couldn't save your mood: {exc}", severity="error")
+            return
+        self.sound_manager.play_save(score)
 
         self.preferences.last_selected_mood_index = self.selected_index
         save_preferences(self.preferences)
@@ -1215,7 +1659,7 @@ class MainScreen(Screen):
 
         asyncio.create_task(self.toast.show(message, self.palette))
 
-        self._refresh_history()
+        self._append_to_history(entry)
 
     def _bar_color_for_score(self, score: int) -> str:
         """Get color for a mood score."""
@@ -1232,51 +1676,6 @@ class MainScreen(Screen):
             return ":("
         return ":'("
 
-    def _format_time_gap(self, seconds: float) -> str:
-        """Format time gap in human-readable format."""
-        if seconds < 60:
-            return "< 1m"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f"{minutes}m"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            if minutes > 0:
-                return f"{hours}h {minutes}m"
-            return f"{hours}h"
-        else:
-            days = int(seconds / 86400)
-            hours = int((seconds % 86400) / 3600)
-            if hours > 0:
-                return f"{days}d {hours}h"
-            return f"{days}d"
-
-    def _label_for_score(self, score: int) -> str:
-        """Get mood label for score."""
-        if score >= 9:
-            return "Great"
-        if score >= 7:
-            return "Good"
-        if score >= 5:
-            return "Meh"
-        if score >= 3:
-            return "Bad"
-        return "Awful"
-
-    def _fixed_bar_length_for_score(self, score: int) -> int:
-        """Get fixed bar length based on mood intensity (not relative)."""
-        # Great = 8 blocks, Awful = 2 blocks
-        if score >= 9:
-            return 8
-        if score >= 7:
-            return 6
-        if score >= 5:
-            return 4
-        if score >= 3:
-            return 3
-        return 2
-
     def _calculate_scaled_bar_length(
         self, score: int, max_score: int, max_bar_width: int = 20
     ) -> int:
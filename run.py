@@ -1,4 +1,43 @@
-from mood_tracker.app import MoodTrackerApp
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Track your vibes in the terminal")
+    parser.add_argument(
+        "--migrate-sqlite",
+        action="store_true",
+        help="copy your mood history into a SQLite database and use it from now on",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="start the app, close it once the history is shown and report where the time went",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        metavar="MS",
+        help="with --profile-startup, exit with status 1 if the first frame takes longer",
+    )
+    args = parser.parse_args()
+
+    if args.migrate_sqlite:
+        from mood_tracker.models.storage import DB_FILE, migrate_to_sqlite
+
+        count = migrate_to_sqlite()
+        print(f"✓ Migrated {count} entries to {DB_FILE}")
+        return
+
+    if args.profile_startup:
+        from mood_tracker.profiling import profile_startup
+
+        raise SystemExit(profile_startup(args.startup_budget))
+
+    # Imported here so --profile-startup can time the import itself
+    from mood_tracker.app import MoodTrackerApp
 
-if __name__ == "__main__":
     MoodTrackerApp().run()
+
+
+if __name__ == "__main__":
+    main()
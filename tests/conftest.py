@@ -0,0 +1,11 @@
+"""Shared test setup.
+
+The storage modules resolve their paths under ``~/.mood_tracker`` when
+they're imported, so point the home folder somewhere disposable before
+any test imports them. Tests build their own stores under ``tmp_path``.
+"""
+
+import os
+import tempfile
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="mood-tracker-home-")
@@ -0,0 +1,92 @@
+import pytest
+
+from mood_tracker import audio
+from mood_tracker.audio import (
+    SAVE,
+    SAVE_NOTES,
+    SELECT,
+    SELECT_DURATION,
+    SoundManager,
+    pitch_for_score,
+    synthesize_tone,
+)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    pytest.importorskip("pygame")
+    # No sound card needed: SDL plays into nothing
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    manager = SoundManager(fallback=lambda: None)
+    assert manager.ready.wait(10)
+    assert manager.enabled
+    yield manager
+    manager.close()
+
+
+class _FakeSound:
+    def __init__(self, plays, name, length):
+        self.plays = plays
+        self.name = name
+        self.length = length
+
+    def play(self):
+        self.plays.append(self.name)
+
+    def get_length(self):
+        return self.length
+
+
+def test_pitch_rises_a_whole_tone_per_point():
+    assert pitch_for_score(5) == pytest.approx(440.0)
+    assert pitch_for_score(11) == pytest.approx(880.0)
+    assert pitch_for_score(1) < pitch_for_score(5) < pitch_for_score(10)
+
+
+def test_tone_fades_in_and_decays(monkeypatch):
+    monkeypatch.setattr(audio, "numpy", None)
+    samples = synthesize_tone(440.0, 0.1, 22050)
+    assert samples.typecode == "h"
+    assert len(samples) == 2205
+    peak = max(abs(s) for s in samples)
+    assert 0 < peak <= audio.VOLUME * 32767
+    assert samples[0] == 0
+    assert max(abs(s) for s in samples[-50:]) < peak / 50
+
+
+def test_stereo_tone_repeats_each_sample_per_channel(monkeypatch):
+    monkeypatch.setattr(audio, "numpy", None)
+    mono = synthesize_tone(440.0, 0.05, 22050)
+    stereo = synthesize_tone(440.0, 0.05, 22050, channels=2)
+    assert list(stereo[0::2]) == list(mono)
+    assert list(stereo[1::2]) == list(mono)
+
+
+def test_numpy_tone_matches_the_pure_python_one(monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    monkeypatch.setattr(audio, "numpy", numpy)
+    vectorized = synthesize_tone(523.25, 0.06, 22050, channels=2)
+    monkeypatch.setattr(audio, "numpy", None)
+    plain = synthesize_tone(523.25, 0.06, 22050, channels=2)
+    assert len(vectorized) == len(plain)
+    assert max(abs(a - b) for a, b in zip(vectorized, plain)) <= 1
+
+
+def test_sounds_are_synthesized_once_per_mood(manager):
+    select = manager._sound(SELECT, 7)
+    assert manager._sound(SELECT, 7) is select
+    assert manager._sound(SELECT, 3) is not select
+    assert select.get_length() == pytest.approx(SELECT_DURATION, abs=0.01)
+    save = manager._sound(SAVE, 7)
+    assert save.get_length() == pytest.approx(sum(d for _, d in SAVE_NOTES), abs=0.01)
+
+
+def test_clicks_that_arrive_while_one_is_playing_are_dropped(manager):
+    plays = []
+    manager._sound = lambda name, score: _FakeSound(plays, name, length=10)
+    # An arrow key held down: a burst of clicks within one click's length
+    for score in range(1, 11):
+        manager.play_selection(score)
+    manager.play_save(7)
+    manager.close()
+    assert plays == [SELECT, SAVE]
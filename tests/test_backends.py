@@ -0,0 +1,110 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from mood_tracker.models.storage import (
+    MoodEntry,
+    MoodRepository,
+    ShardedBackend,
+    SqliteBackend,
+    StorageBackend,
+)
+from mood_tracker.models.writer import WriteBehindWriter
+
+START = datetime(2025, 11, 20, 7, 30)
+
+QUERIES = [
+    (None, None, None, False),
+    (None, None, 12, True),
+    (None, None, 5, False),
+    (None, None, 0, True),
+    (datetime(2026, 1, 1), datetime(2026, 2, 1), None, False),
+    (datetime(2026, 1, 1), datetime(2026, 2, 1), 3, True),
+    (datetime(2025, 12, 15, 12, 30), datetime(2026, 2, 3, 6), None, True),
+    (datetime(2026, 2, 1), None, None, False),
+    (None, datetime(2025, 12, 1), 4, True),
+    # Bounds with sub-second precision, and an empty range
+    (datetime(2026, 1, 5, 0, 0, 0, 500000), datetime(2026, 1, 9, 23, 59, 59, 1), None, False),
+    (datetime(2030, 1, 1), None, None, False),
+]
+
+
+def _history():
+    rng = random.Random(3)
+    moment = START
+    entries = []
+    for i in range(300):
+        moment += timedelta(hours=rng.choice([2, 5, 9, 14]), seconds=rng.randint(1, 59))
+        entries.append(MoodEntry(moment, rng.randint(1, 10), tag=None, note=f"note {i}"))
+    return entries
+
+
+class ListBackend(StorageBackend):
+    """The plain in-memory reference: every query is a scan of the list."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    def ensure(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def signature(self):
+        return 0
+
+    def load_all(self):
+        return sorted(self.entries, key=lambda entry: entry.epoch)
+
+
+def _sharded(tmp_path, entries):
+    backend = ShardedBackend(tmp_path / "shards", WriteBehindWriter(), compact_threshold=1000)
+    backend.ensure()
+    # Most entries compacted into snapshots, the rest in the journal out
+    # of order, as an import or a changed clock would leave them
+    backend.replace_all(entries[:200]).result()
+    tail = entries[200:]
+    random.Random(5).shuffle(tail)
+    for entry in tail:
+        backend.append(entry)
+    return backend
+
+
+def _sqlite(tmp_path, entries):
+    backend = SqliteBackend(tmp_path / "moods.db", WriteBehindWriter())
+    backend.ensure()
+    backend.replace_all(entries).result()
+    return backend
+
+
+@pytest.fixture(params=["sharded", "sqlite"])
+def backend(request, tmp_path):
+    make = _sharded if request.param == "sharded" else _sqlite
+    backend = make(tmp_path, _history())
+    yield backend
+    if isinstance(backend, SqliteBackend):
+        backend.close()
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_query_range_matches_the_reference(backend, query):
+    reference = ListBackend(_history())
+    assert backend.query_range(*query) == reference.query_range(*query)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_repository_query_is_the_same_cold_and_warm(backend, query):
+    expected = ListBackend(_history()).query_range(*query)
+    cold = MoodRepository(backend)
+    assert cold.query(*query) == expected
+    warm = MoodRepository(backend)
+    warm.entries()
+    assert warm.query(*query) == expected
+
+
+def test_full_reads_match_the_reference(backend):
+    reference = ListBackend(_history())
+    assert list(backend.iter_all()) == reference.load_all()
+    assert backend.load_rollups().to_json() == reference.load_rollups().to_json()
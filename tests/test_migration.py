@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from mood_tracker.models import storage
+from mood_tracker.models.storage import MoodEntry, MoodRepository, ShardedBackend, SqliteBackend
+
+START = datetime(2026, 2, 1, 8, 0)
+
+
+@pytest.fixture
+def data_path(tmp_path, monkeypatch):
+    """Point the app's storage paths at an empty folder."""
+    monkeypatch.setattr(storage, "DATA_PATH", tmp_path)
+    monkeypatch.setattr(storage, "DATA_FILE", tmp_path / "moods.json")
+    monkeypatch.setattr(storage, "JOURNAL_FILE", tmp_path / "moods.jsonl")
+    monkeypatch.setattr(storage, "SHARD_DIR", tmp_path / "moods")
+    monkeypatch.setattr(storage, "MANIFEST_FILE", tmp_path / "moods" / "manifest.json")
+    monkeypatch.setattr(storage, "DB_FILE", tmp_path / "moods.db")
+    return tmp_path
+
+
+def _use_active_store(monkeypatch):
+    monkeypatch.setattr(storage, "repository", MoodRepository(storage.open_backend()))
+
+
+def _fill_shards(directory, count=50):
+    entries = [MoodEntry(START + timedelta(hours=11 * i), i % 10 + 1) for i in range(count)]
+    ShardedBackend(directory).replace_all(entries).result()
+    return entries
+
+
+def test_migrate_to_sqlite_moves_everything(data_path):
+    entries = _fill_shards(data_path / "moods")
+    assert storage.migrate_to_sqlite() == len(entries)
+    assert SqliteBackend(data_path / "moods.db").load_all() == entries
+    assert not (data_path / "moods").exists()
+    assert (data_path / "moods.migrated" / "manifest.json").exists()
+
+
+def test_migrate_to_sqlite_refuses_to_clobber_an_earlier_migration(data_path):
+    entries = _fill_shards(data_path / "moods")
+    (data_path / "moods.migrated").mkdir()
+    with pytest.raises(FileExistsError):
+        storage.migrate_to_sqlite()
+    # Nothing changed: the shards are still the only store
+    assert not (data_path / "moods.db").exists()
+    assert not (data_path / "moods.db.tmp").exists()
+    assert ShardedBackend(data_path / "moods").load_all() == entries
+
+
+@pytest.mark.parametrize("legacy", ["moods.jsonl", "moods.json"])
+def test_first_run_splits_a_legacy_file_into_shards(data_path, monkeypatch, legacy):
+    entries = [MoodEntry(START + timedelta(days=9 * i), i % 10 + 1) for i in range(20)]
+    source = data_path / legacy
+    if legacy == "moods.jsonl":
+        source.write_text("".join(storage._encode_line(entry) for entry in entries))
+    else:
+        source.write_text(json.dumps([entry.to_dict() for entry in entries]))
+    _use_active_store(monkeypatch)
+
+    storage.init_storage()
+    assert storage.load_moods() == entries
+    assert not source.exists()
+    assert (data_path / (legacy + ".migrated")).exists()
+    assert (data_path / "moods" / "manifest.json").exists()
+
+
+def test_init_storage_leaves_no_shards_beside_a_database(data_path, monkeypatch):
+    entries = _fill_shards(data_path / "moods")
+    storage.migrate_to_sqlite()
+    _use_active_store(monkeypatch)
+
+    storage.init_storage()
+    assert storage.load_moods() == entries
+    assert not (data_path / "moods").exists()
@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+from mood_tracker.models.preferences import PreferencesStore, UserPreferences
+from mood_tracker.models.writer import WriteBehindWriter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _counting_writer():
+    """A writer that records every replacement it's asked for."""
+    writer = WriteBehindWriter()
+    replaced = []
+    replace = writer.replace
+
+    def counting(path, text):
+        replaced.append(text)
+        return replace(path, text)
+
+    writer.replace = counting
+    return writer, replaced
+
+
+def test_a_burst_of_saves_is_written_once(tmp_path):
+    writer, replaced = _counting_writer()
+    path = tmp_path / "preferences.json"
+    store = PreferencesStore(path, delay=0.1, writer=writer)
+    prefs = store.load()
+    for index in range(20):
+        prefs.last_selected_mood_index = index % 5
+        store.save()
+    assert not replaced
+
+    time.sleep(0.4)
+    writer.flush(5)
+    assert len(replaced) == 1
+    assert json.loads(path.read_text())["last_selected_mood_index"] == 19 % 5
+
+
+def test_each_save_pushes_the_write_back(tmp_path):
+    writer, replaced = _counting_writer()
+    store = PreferencesStore(tmp_path / "preferences.json", delay=0.2, writer=writer)
+    prefs = store.load()
+    # Keep changing for longer than the delay, with shorter gaps than it
+    for index in range(6):
+        prefs.last_selected_mood_index = index
+        store.save()
+        time.sleep(0.05)
+    assert not replaced
+    time.sleep(0.5)
+    writer.flush(5)
+    assert len(replaced) == 1
+
+
+def test_flush_writes_pending_changes_right_away(tmp_path):
+    writer, replaced = _counting_writer()
+    path = tmp_path / "preferences.json"
+    store = PreferencesStore(path, delay=60, writer=writer)
+    store.save(UserPreferences(current_theme="storm_witch"))
+    store.flush().result(5)
+    assert json.loads(path.read_text())["current_theme"] == "storm_witch"
+    # Nothing is pending any more, so flushing again doesn't write
+    store.flush().result(5)
+    assert len(replaced) == 1
+
+
+def test_pending_changes_are_written_at_exit(tmp_path):
+    path = tmp_path / "preferences.json"
+    script = textwrap.dedent(
+        f"""
+        from pathlib import Path
+        from mood_tracker.models.preferences import PreferencesStore, UserPreferences
+
+        # Exits long before the debounce timer would fire
+        store = PreferencesStore(Path({str(path)!r}), delay=60)
+        store.save(UserPreferences(current_theme="storm_witch"))
+        """
+    )
+    subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "HOME": str(tmp_path)},
+        check=True,
+        timeout=60,
+    )
+    assert json.loads(path.read_text())["current_theme"] == "storm_witch"
@@ -0,0 +1,16 @@
+import pytest
+
+from mood_tracker import profiling
+
+
+def test_import_breakdown_runs_from_the_project_root(tmp_path, monkeypatch):
+    # run.py may be started from anywhere; the child must still find the app
+    monkeypatch.chdir(tmp_path)
+    packages = profiling.import_breakdown("mood_tracker.models.writer")
+    # Only there if the writer module was actually found and imported
+    assert "concurrent" in packages
+
+
+def test_import_breakdown_reports_a_failed_import():
+    with pytest.raises(RuntimeError, match="no_such_module"):
+        profiling.import_breakdown("no_such_module")
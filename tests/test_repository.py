@@ -0,0 +1,159 @@
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+
+from mood_tracker.models import storage
+from mood_tracker.models.storage import MoodEntry, MoodRepository, ShardedBackend
+from mood_tracker.models.writer import WriteBehindWriter
+
+START = datetime(2026, 1, 1, 8, 0)
+
+
+def _entries(count):
+    return [
+        MoodEntry(START + timedelta(hours=7 * i), i % 10 + 1, note=f"#{i}") for i in range(count)
+    ]
+
+
+def _repository(directory, entries):
+    backend = ShardedBackend(directory, WriteBehindWriter())
+    backend.replace_all(entries).result()
+    return MoodRepository(backend)
+
+
+def _counting_loads(repository):
+    """Count how often ``repository`` reads the whole store back."""
+    loads = []
+    load_all = repository.backend.load_all
+
+    def counting():
+        loads.append(1)
+        return load_all()
+
+    repository.backend.load_all = counting
+    return loads
+
+
+def test_cache_is_trusted_while_the_files_are_unchanged(tmp_path):
+    entries = _entries(20)
+    repository = _repository(tmp_path, entries)
+    repository.revalidate_interval = 0
+    loads = _counting_loads(repository)
+    for _ in range(5):
+        assert repository.entries() == entries
+    assert len(loads) == 1
+
+
+def test_cache_reloads_when_another_process_grows_the_journal(tmp_path):
+    entries = _entries(20)
+    repository = _repository(tmp_path, entries)
+    repository.revalidate_interval = 0
+    repository.entries()
+    # Another instance of the app logs a mood: the journal's size changes
+    later = MoodEntry(START + timedelta(days=30), 7)
+    ShardedBackend(tmp_path, WriteBehindWriter()).append(later).result()
+    assert repository.entries() == entries + [later]
+
+
+def test_cache_reloads_when_only_the_mtime_changed(tmp_path):
+    repository = _repository(tmp_path, _entries(20))
+    repository.revalidate_interval = 0
+    loads = _counting_loads(repository)
+    repository.entries()
+    manifest = tmp_path / "manifest.json"
+    st = manifest.stat()
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    repository.entries()
+    assert len(loads) == 2
+
+
+def test_cache_reloads_when_the_manifest_was_swapped_for_a_new_file(tmp_path):
+    repository = _repository(tmp_path, _entries(20))
+    repository.revalidate_interval = 0
+    loads = _counting_loads(repository)
+    repository.entries()
+    # Same size and mtime, but a different file (an atomic replace)
+    manifest = tmp_path / "manifest.json"
+    st = manifest.stat()
+    replacement = tmp_path / "manifest.json.new"
+    replacement.write_bytes(manifest.read_bytes())
+    os.replace(replacement, manifest)
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert manifest.stat().st_ino != st.st_ino
+    repository.entries()
+    assert len(loads) == 2
+
+
+def test_small_query_on_a_cold_cache_reads_only_the_store(tmp_path):
+    entries = _entries(300)
+    repository = _repository(tmp_path, entries)
+    assert repository.query(limit=12, reverse=True) == entries[::-1][:12]
+    month = repository.query(datetime(2026, 2, 1), datetime(2026, 3, 1))
+    assert month == [e for e in entries if e.timestamp.month == 2]
+    assert repository._entries is None
+
+
+def test_unbounded_query_warms_the_cache(tmp_path):
+    entries = _entries(300)
+    repository = _repository(tmp_path, entries)
+    assert repository.query() == entries
+    assert repository._entries == entries
+    assert list(repository._epochs) == [e.epoch for e in entries]
+
+    # Later queries are served from the index, even small ones
+    repository.backend.query_range = None
+    assert repository.query(limit=3, reverse=True) == entries[::-1][:3]
+    assert repository.query(START, START + timedelta(days=1)) == entries[:4]
+
+
+def test_append_mood_async_does_not_block_the_loop_on_the_lock(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, _entries(10))
+    monkeypatch.setattr(storage, "repository", repository)
+    entry = MoodEntry(START + timedelta(days=30), 9)
+
+    async def main():
+        ticks = 0
+        # A background reload holding the lock
+        with repository._lock:
+            task = asyncio.create_task(storage.append_mood_async(entry))
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            assert not task.done()
+        await task
+        return ticks
+
+    assert asyncio.run(main()) == 5
+    assert repository.query()[-1] == entry
+
+
+def test_cancelling_append_mood_async_still_saves_the_entry(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, _entries(10))
+    monkeypatch.setattr(storage, "repository", repository)
+    writer = repository.backend.writer
+    entry = MoodEntry(START + timedelta(days=30), 9)
+    release = threading.Event()
+    # Load the journal state now; doing it inside the save would flush the writer
+    repository.append(MoodEntry(START + timedelta(days=29), 5)).result(5)
+
+    async def main():
+        # Keep the writer busy so the save is still queued when we cancel
+        writer.call(lambda: release.wait(5))
+        task = asyncio.create_task(storage.append_mood_async(entry))
+        for _ in range(100):
+            if writer.pending > 1:
+                break
+            await asyncio.sleep(0.01)
+        assert writer.pending == 2
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        release.set()
+
+    asyncio.run(main())
+    assert writer.flush(5)
+    reloaded = MoodRepository(ShardedBackend(tmp_path, WriteBehindWriter()))
+    assert reloaded.query()[-1] == entry
@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timedelta
+
+from mood_tracker.models.rollups import Rollups
+from mood_tracker.models.storage import MoodEntry
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def _state(rollups):
+    """Everything a Rollups holds, in comparable form."""
+    return (
+        rollups.to_json(),
+        {key: month.to_json() for key, month in rollups.months.items()},
+        rollups.overall.to_json(),
+        {name: (t.run_end, t.run_length, t.longest) for name, t in rollups.streaks.items()},
+    )
+
+
+def _history(seed, count=400):
+    rng = random.Random(seed)
+    moment = START
+    entries = []
+    for _ in range(count):
+        # Mostly a few hours apart, now and then a gap of days that breaks a streak
+        moment += timedelta(hours=rng.choice([3, 5, 8, 20, 30, 75]))
+        entries.append(MoodEntry(moment, rng.randint(1, 10)))
+    return entries
+
+
+def _added(entries):
+    rollups = Rollups()
+    for entry in entries:
+        rollups.add(entry)
+    return rollups
+
+
+def test_adding_in_order_matches_a_rebuild():
+    for seed in range(5):
+        entries = _history(seed)
+        assert _state(_added(entries)) == _state(Rollups.from_entries(entries))
+
+
+def test_adding_out_of_order_matches_a_rebuild():
+    for seed in range(5):
+        entries = _history(seed)
+        shuffled = list(entries)
+        random.Random(seed).shuffle(shuffled)
+        assert _state(_added(shuffled)) == _state(Rollups.from_entries(entries))
+
+
+def test_low_entry_that_ends_todays_streak():
+    entries = [MoodEntry(START + timedelta(days=i), 8) for i in range(5)]
+    rollups = _added(entries)
+    today = entries[-1].timestamp.date()
+    assert rollups.streaks["above_meh"].current(today) == 5
+
+    # Two bad moods drag today's average down to Meh, ending the streak
+    low = [MoodEntry(entries[-1].timestamp + timedelta(hours=h), 1) for h in (1, 2)]
+    for entry in low:
+        rollups.add(entry)
+    assert rollups.streaks["above_meh"].current(today) == 0
+    assert rollups.streaks["above_meh"].longest == 4
+    assert rollups.streaks["any"].current(today) == 5
+    assert _state(rollups) == _state(Rollups.from_entries(entries + low))
+
+
+def test_json_round_trip():
+    entries = _history(7)
+    rollups = Rollups.from_entries(entries)
+    assert _state(Rollups.from_json(rollups.to_json())) == _state(rollups)
+    # Saved rollups keep counting from where they left off
+    more = _history(8, 50)
+    more = [MoodEntry(e.timestamp + (entries[-1].timestamp - START), e.score) for e in more]
+    loaded = Rollups.from_json(rollups.to_json())
+    for entry in more:
+        loaded.add(entry)
+    assert _state(loaded) == _state(Rollups.from_entries(entries + more))
@@ -0,0 +1,187 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from mood_tracker.models import storage
+from mood_tracker.models.rollups import Rollups
+from mood_tracker.models.storage import MoodEntry, ShardedBackend
+from mood_tracker.models.writer import WriteBehindWriter
+
+START = datetime(2026, 1, 30, 8, 0)
+
+
+def _entries(count, start=START, score=None):
+    return [
+        MoodEntry(start + timedelta(hours=9 * i), score or i % 10 + 1, note=f"#{i}")
+        for i in range(count)
+    ]
+
+
+def _backend(directory, **kwargs):
+    return ShardedBackend(directory, WriteBehindWriter(), **kwargs)
+
+
+def _reopened(directory):
+    """The store as the next launch sees it."""
+    backend = _backend(directory)
+    backend.ensure()
+    return backend
+
+
+class Crash(Exception):
+    pass
+
+
+def _crash_on_write(monkeypatch, should_crash):
+    """Make atomic_write_text raise, as if the process died, when ``should_crash`` says so."""
+    real = storage.atomic_write_text
+
+    def write(path, text):
+        if should_crash(path, text):
+            raise Crash(path.name)
+        real(path, text)
+
+    monkeypatch.setattr(storage, "atomic_write_text", write)
+
+
+def test_replace_all_replaces_snapshots_and_journal(tmp_path):
+    backend = _backend(tmp_path)
+    backend.ensure()
+    for entry in _entries(20):
+        backend.append(entry)
+    replacement = _entries(30, START + timedelta(days=60), score=7)
+    backend.replace_all(replacement).result()
+
+    assert _reopened(tmp_path).load_all() == replacement
+    assert (tmp_path / "journal.jsonl").read_bytes() == b""
+    # Only the new generation's files are left
+    generation = json.loads((tmp_path / "manifest.json").read_text())["generation"]
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == sorted(
+        ["journal.jsonl", "manifest.json", f"rollups.{generation}.json"]
+        + [f"2026-0{month}.{generation}.jsonl" for month in (3, 4)]
+    )
+
+
+def test_replace_all_crash_before_emptying_the_journal(tmp_path, monkeypatch):
+    backend = _backend(tmp_path)
+    backend.ensure()
+    for entry in _entries(20):
+        backend.append(entry)
+    backend.flush()
+
+    replacement = _entries(5, START + timedelta(days=60))
+    _crash_on_write(monkeypatch, lambda path, text: path.name == "journal.jsonl")
+    with pytest.raises(Crash):
+        backend.replace_all(replacement).result()
+    monkeypatch.undo()
+
+    # The journal still holds the old entries, but the manifest says
+    # they're already part of the snapshot
+    assert (tmp_path / "journal.jsonl").stat().st_size > 0
+    assert _reopened(tmp_path).load_all() == replacement
+
+
+def test_replace_all_crash_before_the_manifest_keeps_the_old_store(tmp_path, monkeypatch):
+    backend = _backend(tmp_path)
+    backend.ensure()
+    old = _entries(20)
+    for entry in old:
+        backend.append(entry)
+    backend.flush()
+
+    _crash_on_write(monkeypatch, lambda path, text: path.name == "manifest.json")
+    with pytest.raises(Crash):
+        backend.replace_all(_entries(5, START + timedelta(days=60))).result()
+    monkeypatch.undo()
+
+    assert _reopened(tmp_path).load_all() == old
+
+
+def test_journal_replay_skips_a_torn_last_line(tmp_path):
+    backend = _backend(tmp_path)
+    backend.ensure()
+    entries = _entries(10)
+    for entry in entries:
+        backend.append(entry)
+    backend.flush()
+    # A crash in the middle of writing the next line
+    with (tmp_path / "journal.jsonl").open("ab") as f:
+        f.write(b'{"timestamp": "2026-03-01T08:00:00", "sco')
+
+    reopened = _reopened(tmp_path)
+    assert reopened.load_all() == entries
+    # The next entry starts on a line of its own, so it isn't lost too
+    later = MoodEntry(START + timedelta(days=40), 6)
+    reopened.append(later).result()
+    assert _reopened(tmp_path).load_all() == entries + [later]
+
+
+def _store_with_tail(directory):
+    """A store with compacted snapshots plus an uncompacted journal tail."""
+    backend = _backend(directory, compact_threshold=1000)
+    backend.ensure()
+    entries = _entries(40)
+    backend.replace_all(entries[:25]).result()
+    for entry in entries[25:]:
+        backend.append(entry)
+    backend.flush()
+    return backend, entries
+
+
+def test_compaction_folds_the_journal_into_snapshots(tmp_path):
+    backend, entries = _store_with_tail(tmp_path)
+    backend.compact().result()
+    assert (tmp_path / "journal.jsonl").read_bytes() == b""
+    assert json.loads((tmp_path / "manifest.json").read_text())["journal_offset"] == 0
+    reopened = _reopened(tmp_path)
+    assert reopened.load_all() == entries
+    assert reopened.load_rollups().overall.count == len(entries)
+
+
+def test_compaction_runs_once_the_journal_passes_the_threshold(tmp_path):
+    backend = _backend(tmp_path, compact_threshold=10)
+    backend.ensure()
+    entries = _entries(25)
+    for entry in entries:
+        backend.append(entry)
+    backend.flush()
+    assert len((tmp_path / "journal.jsonl").read_text().splitlines()) == 5
+    assert _reopened(tmp_path).load_all() == entries
+
+
+def test_compaction_survives_a_crash_at_every_write(tmp_path, monkeypatch):
+    # Count the file writes one compaction makes
+    writes = []
+    backend, _ = _store_with_tail(tmp_path / "count")
+    _crash_on_write(monkeypatch, lambda path, text: writes.append(path.name) and False)
+    backend.compact().result()
+    monkeypatch.undo()
+    assert writes[-3:] == ["manifest.json", "journal.jsonl", "manifest.json"]
+
+    for crash_at in range(len(writes)):
+        directory = tmp_path / f"crash-{crash_at}"
+        backend, entries = _store_with_tail(directory)
+        count = iter(range(len(writes)))
+        _crash_on_write(monkeypatch, lambda path, text: next(count) == crash_at)
+        with pytest.raises(Crash):
+            backend.compact().result()
+        monkeypatch.undo()
+
+        reopened = _reopened(directory)
+        assert reopened.load_all() == entries, writes[crash_at]
+        assert reopened.load_rollups().overall.count == len(entries)
+        # The next launch carries on normally, including compacting again
+        later = MoodEntry(START + timedelta(days=90), 4)
+        reopened.append(later)
+        reopened.compact().result()
+        assert _reopened(directory).load_all() == entries + [later]
+
+
+def test_saved_rollups_plus_the_tail_match_a_rebuild(tmp_path):
+    backend, entries = _store_with_tail(tmp_path)
+    expected = Rollups.from_entries(entries)
+    assert _reopened(tmp_path).load_rollups().to_json() == expected.to_json()
+    backend.compact().result()
+    assert _reopened(tmp_path).load_rollups().to_json() == expected.to_json()
@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from mood_tracker import theme
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    """A private copy of themes.json and its precompiled cache."""
+    themes_file = tmp_path / "themes.json"
+    shutil.copy(theme.THEMES_FILE, themes_file)
+    monkeypatch.setattr(theme, "THEMES_FILE", themes_file)
+    monkeypatch.setattr(theme, "THEME_CACHE_FILE", tmp_path / "themes.cache")
+    _forget()
+    yield themes_file
+    _forget()
+
+
+def _forget():
+    """Forget what this process loaded, like a fresh launch."""
+    theme._catalog.cache_clear()
+    theme.get_palette.cache_clear()
+    theme.get_border_style.cache_clear()
+    theme.compile_theme.cache_clear()
+    theme.writer.flush()
+
+
+def _set_background(themes_file, colour):
+    data = json.loads(themes_file.read_text())
+    data["themes"]["midnight"]["palette"]["bg"] = colour
+    themes_file.write_text(json.dumps(data, indent=2))
+
+
+def test_next_launch_reads_the_precompiled_catalog(catalog, monkeypatch):
+    names = theme.theme_names()
+    _forget()
+    assert theme.THEME_CACHE_FILE.exists()
+
+    def no_json():
+        raise AssertionError("themes.json was parsed again")
+
+    monkeypatch.setattr(theme, "_read_themes_file", no_json)
+    assert theme.theme_names() == names
+
+
+def test_editing_themes_json_rebuilds_the_cache(catalog):
+    assert theme.get_palette("midnight").bg == "#050814"
+    _forget()
+    _set_background(catalog, "#123456")
+    assert theme.get_palette("midnight").bg == "#123456"
+    _forget()
+    # The rebuilt cache is the one used from now on
+    assert theme.get_palette("midnight").bg == "#123456"
+
+
+def test_an_edit_that_keeps_the_size_still_rebuilds_the_cache(catalog):
+    theme.theme_names()
+    _forget()
+    st = catalog.stat()
+    catalog.write_text(catalog.read_text().replace('"#050814"', '"#050815"', 1))
+    assert catalog.stat().st_size == st.st_size
+    os.utime(catalog, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert theme.get_palette("midnight").bg == "#050815"
+
+
+def test_an_unreadable_cache_is_rebuilt(catalog):
+    theme.THEME_CACHE_FILE.write_bytes(b"not marshal data")
+    assert theme.get_palette("midnight").bg == "#050814"
+    _forget()
+    assert theme.THEME_CACHE_FILE.read_bytes() != b"not marshal data"
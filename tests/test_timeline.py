@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from mood_tracker.models.storage import MoodEntry
+from mood_tracker.views.main import TimelineCache, build_timeline
+
+START = datetime(2026, 3, 1, 8, 0)
+
+
+def _entries(count, start=START):
+    return [MoodEntry(start + timedelta(hours=5 * i), i % 10 + 1) for i in range(count)]
+
+
+def _copies(entries):
+    # What a reload from the store hands back: equal, but new objects
+    return [MoodEntry.from_dict(entry.to_dict()) for entry in entries]
+
+
+def test_build_reuses_the_timeline_for_reloaded_entries():
+    entries = _entries(40)
+    cache = TimelineCache()
+    days = cache.build(entries)
+    assert cache.build(_copies(entries)) is days
+
+
+def test_build_extends_when_the_history_only_grew():
+    entries = _entries(40)
+    cache = TimelineCache()
+    before = list(cache.build(entries))
+    grown = _copies(entries) + _entries(10, entries[-1].timestamp + timedelta(hours=1))
+    after = cache.build(grown)
+    assert after == build_timeline(grown)
+    # Cards before the last one are the same objects
+    assert all(a is b for a, b in zip(before[:-1], after))
+
+
+def test_build_rebuilds_when_an_entry_changed():
+    entries = _entries(40)
+    cache = TimelineCache()
+    cache.build(entries)
+    changed = _copies(entries)
+    changed[5] = MoodEntry(changed[5].timestamp, changed[5].score % 10 + 1)
+    assert cache.build(changed) == build_timeline(changed)
+
+
+def test_compute_leaves_the_cache_alone_until_stored():
+    entries = _entries(40)
+    cache = TimelineCache()
+    days = cache.build(entries)
+    grown = _copies(entries) + _entries(10, entries[-1].timestamp + timedelta(hours=1))
+    computed = cache.compute(grown)
+    # A cancelled refresh never stores, so the cache still extends what was shown
+    assert cache.days is days
+    assert cache.compute(grown) == computed
+    cache.store(grown, computed)
+    assert cache.days is computed
+    assert cache.build(_copies(grown)) is computed
+
+
+def _appended(entries, window):
+    """Append ``entries`` one by one, checking each step against a rebuild."""
+    cache = TimelineCache()
+    cache.build([])
+    seen = []
+    for entry in entries:
+        before = list(cache.days)
+        changed = cache.append(entry, window)
+        seen.append(entry)
+        shown = seen if window is None else seen[-window:]
+        assert cache.days == build_timeline(shown)
+        # Cards before the changed one are the ones that were there
+        assert all(a is b for a, b in zip(before[:changed], cache.days))
+    return cache
+
+
+def test_append_matches_a_rebuild():
+    _appended(_entries(60), None)
+
+
+def test_append_matches_a_rebuild_as_the_window_slides():
+    # Several entries a day, so the window's first card shrinks and then drops off
+    _appended(_entries(60), 12)
+    # One entry a day, so every slide drops a whole card
+    daily = [MoodEntry(START + timedelta(days=i), i % 10 + 1) for i in range(30)]
+    _appended(daily, 5)
+
+
+def test_append_refuses_an_entry_out_of_order():
+    entries = _entries(10)
+    cache = TimelineCache()
+    cache.build(entries)
+    assert cache.append(MoodEntry(entries[3].timestamp, 5)) is None
+    assert cache.days == build_timeline(entries)
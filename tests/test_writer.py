@@ -0,0 +1,150 @@
+import threading
+
+import pytest
+
+from mood_tracker.models.writer import WriteBehindWriter, durable_append
+
+
+def _queue_one_batch(writer, queue_ops):
+    """Run ``queue_ops`` while the writer thread is busy, so its ops land in one batch."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    writer.call(block)
+    assert started.wait(5)
+    futures = queue_ops()
+    release.set()
+    for future in futures:
+        future.result(5)
+
+
+def test_writes_keep_their_order_across_a_call(tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    manifest = tmp_path / "manifest.json"
+    writer = WriteBehindWriter()
+
+    def compact():
+        # Like a compaction: fold what's there into the snapshot, empty the journal
+        assert journal.read_bytes() == b"first\n"
+        journal.write_bytes(b"")
+
+    _queue_one_batch(
+        writer,
+        lambda: [
+            writer.append(journal, b"first\n"),
+            writer.call(compact),
+            writer.append(journal, b"second\n"),
+            writer.replace(manifest, "{}"),
+        ],
+    )
+    assert journal.read_bytes() == b"second\n"
+    assert manifest.read_text() == "{}"
+
+
+def test_replace_of_another_file_splits_a_run(tmp_path):
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    seen = []
+    writer = WriteBehindWriter()
+
+    _queue_one_batch(
+        writer,
+        lambda: [
+            writer.replace(a, "one"),
+            writer.replace(b, "two"),
+            writer.call(lambda: seen.append(a.read_text())),
+            writer.replace(a, "three"),
+        ],
+    )
+    # The call ran between the writes, seeing a as they left it
+    assert seen == ["one"]
+    assert a.read_text() == "three"
+    assert b.read_text() == "two"
+
+
+def test_consecutive_writes_to_a_file_are_merged(tmp_path, monkeypatch):
+    path = tmp_path / "journal.jsonl"
+    calls = []
+    import mood_tracker.models.writer as writer_module
+
+    def counting_append(p, data):
+        calls.append(data)
+        durable_append(p, data)
+
+    monkeypatch.setattr(writer_module, "durable_append", counting_append)
+    writer = WriteBehindWriter()
+    _queue_one_batch(
+        writer,
+        lambda: [
+            writer.append(path, b"a\n"),
+            writer.replace(path, "x\n"),
+            writer.append(path, b"b\n"),
+            writer.append(path, b"c\n"),
+        ],
+    )
+    assert path.read_text() == "x\nb\nc\n"
+    assert calls == [b"b\nc\n"]
+
+
+def test_failure_is_reported_to_its_own_futures(tmp_path):
+    writer = WriteBehindWriter()
+    missing = tmp_path / "file-not-dir"
+    missing.write_text("")
+    bad = writer.append(missing / "child", b"x\n")
+    good = writer.append(tmp_path / "ok", b"y\n")
+    assert isinstance(bad.exception(5), OSError)
+    assert good.result(5) is None
+    assert (tmp_path / "ok").read_bytes() == b"y\n"
+
+
+def test_durable_append_starts_a_fresh_line_after_a_torn_write(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_bytes(b'{"a": 1}\n{"b"')
+    durable_append(path, b'{"c": 3}\n')
+    assert path.read_bytes() == b'{"a": 1}\n{"b"\n{"c": 3}\n'
+
+
+def test_cancelled_write_is_dropped_and_flush_returns(tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    writer = WriteBehindWriter()
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    writer.call(block)
+    assert started.wait(5)
+    first = writer.append(journal, b"first\n")
+    cancelled = writer.append(journal, b"cancelled\n")
+    last = writer.append(journal, b"last\n")
+    assert cancelled.cancel()
+    release.set()
+
+    assert writer.flush(5)
+    assert writer.pending == 0
+    first.result(0)
+    last.result(0)
+    assert journal.read_bytes() == b"first\nlast\n"
+    # The thread survived the cancelled future and keeps writing
+    writer.append(journal, b"after\n").result(5)
+    assert journal.read_bytes() == b"first\nlast\nafter\n"
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_flush_returns_even_if_a_batch_fails_outright(tmp_path, monkeypatch):
+    writer = WriteBehindWriter()
+
+    def broken_commit(batch):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(writer, "_commit", broken_commit)
+    writer.append(tmp_path / "journal.jsonl", b"x\n")
+    assert writer.flush(5)
+    # Let the thread die here, where its exception is expected
+    writer._thread.join(5)